@@ -9,7 +9,7 @@ def main():
     if not log_file_path.exists():
         log_file_path.touch()
     logger.remove()
-    logger.add(log_file_path, rotation='1 MB')
+    logger.add(log_file_path, rotation='1 MB', enqueue=True)
     logger.info('This is a test log message.')
 
 
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from app.core.render_engine import Render
+from framework.core.profiler import profiler
+
+if TYPE_CHECKING:
+    from app.core.widgets.widget import Rect, Widget
+
+
+def intersect(a: Rect, b: Rect) -> Rect | None:
+    left, top = max(a[0], b[0]), max(a[1], b[1])
+    right, bottom = min(a[0] + a[2], b[0] + b[2]), min(a[1] + a[3], b[1] + b[3])
+    if left >= right or top >= bottom:
+        return None
+    return left, top, right - left, bottom - top
+
+
+def subtract(rect: Rect, hole: Rect) -> list[Rect]:
+    """Части rect вне hole: до четырёх непересекающихся прямоугольников."""
+    overlap = intersect(rect, hole)
+    if overlap is None:
+        return [rect]
+    x, y, width, height = rect
+    ox, oy, owidth, oheight = overlap
+    parts = []
+    if oy > y:
+        parts.append((x, y, width, oy - y))
+    if oy + oheight < y + height:
+        parts.append((x, oy + oheight, width, y + height - oy - oheight))
+    if ox > x:
+        parts.append((x, oy, ox - x, oheight))
+    if ox + owidth < x + width:
+        parts.append((ox + owidth, oy, x + width - ox - owidth, oheight))
+    return parts
+
+
+class Layer:
+    """Виджет в прямоугольнике компоновщика на уровне z.
+
+    rect задаётся относительно области компоновщика, None — вся область.
+    Непрозрачный слой закрывает всё под собой; у прозрачного сквозь пустые ячейки
+    (пробел без стиля) видны нижние слои.
+    """
+
+    def __init__(self, widget: Widget, *, rect: Rect | None = None, z: int = 0, opaque: bool = True):
+        self.widget = widget
+        self.rect = rect
+        self.z = z
+        self.opaque = opaque
+
+
+class Compositor:
+    """Собирает слои в Render по z-порядку, отрисовывая только видимые части.
+
+    Для каждого слоя видимые фрагменты — его прямоугольник за вычетом непрозрачных слоёв выше.
+    Полностью закрытые слои не отрисовываются вовсе, а в кадр копируются только видимые фрагменты.
+    """
+
+    def __init__(self, layers: list[Layer] | None = None):
+        self.layers: list[Layer] = []
+        for layer in layers or []:
+            self.add(layer)
+
+    def add(self, layer: Layer) -> Layer:
+        self.layers.append(layer)
+        # Stable: layers with the same z stay in insertion order.
+        self.layers.sort(key=lambda item: item.z)
+        return layer
+
+    def remove(self, layer: Layer) -> None:
+        self.layers.remove(layer)
+
+    def visible(self, area: Rect) -> list[tuple[Layer, Rect, list[Rect]]]:
+        """Слои снизу вверх: абсолютный прямоугольник и его видимые фрагменты внутри area."""
+        x, y, width, height = area
+        result = []
+        occluders: list[Rect] = []
+        for layer in reversed(self.layers):
+            rect = area if layer.rect is None else (x + layer.rect[0], y + layer.rect[1], *layer.rect[2:])
+            clipped = intersect(rect, area)
+            if clipped is None:
+                continue
+            fragments = [clipped]
+            for occluder in occluders:
+                fragments = [part for fragment in fragments for part in subtract(fragment, occluder)]
+                if not fragments:
+                    break
+            result.append((layer, rect, fragments))
+            if layer.opaque:
+                occluders.append(clipped)
+        result.reverse()
+        return result
+
+    def composite(self, target: Render, area: Rect) -> None:
+        """Рисует слои в area; всё, что вне target (например, вида Render.clip), не отрисовывается."""
+        bounds = intersect(area, (target.x, target.y, target.width, target.height))
+        if bounds is None:
+            return
+        for layer, rect, fragments in self.visible(area):
+            fragments = [part for part in (intersect(fragment, bounds) for fragment in fragments) if part is not None]
+            if not fragments:
+                profiler.count('layers_culled')
+                continue
+            if layer.opaque and len(fragments) == 1:
+                view = target.clip(*fragments[0])
+                view.clear()
+                layer.widget._paint(view, *rect)
+                continue
+            # Painted once off-frame, then only the visible cells are copied: re-painting the layer per fragment
+            # would render a widget that is not cacheable several times.
+            scratch = Render.empty(rect[2], rect[3], rect[0], rect[1])
+            layer.widget._paint(scratch, *rect)
+            for fragment in fragments:
+                _copy(scratch.clip(*fragment), target.clip(*fragment), layer.opaque)
+
+
+def _copy(source: Render, target: Render, opaque: bool) -> None:
+    if opaque:
+        target.text[...] = source.text
+        target.style[...] = source.style
+        return
+    mask = (source.text != ' ') | (source.style != 0)
+    target.text[mask] = source.text[mask]
+    target.style[mask] = source.style[mask]
@@ -1,25 +1,88 @@
 import asyncio
+import threading
+from collections import deque
+from typing import Collection, Literal
 
-from loguru import logger
-from pynput.keyboard import Key, KeyCode, Listener
+from pynput.keyboard import Listener
 
-AnyKey = Key | KeyCode
+from app.core.keys import AnyKey, Key
+
+ARROW_KEYS = frozenset({Key.up, Key.down, Key.left, Key.right, Key.page_up, Key.page_down})
 
 
 class InputProcessor:
-    def __init__(self):
+    def __init__(
+        self,
+        *,
+        max_depth: int = 4096,
+        overflow: Literal['drop_oldest', 'drop_newest'] = 'drop_oldest',
+        merge: Collection[AnyKey] = frozenset(),
+    ):
         self._loop = asyncio.get_event_loop()
-        self._queue = asyncio.Queue()
+        self._lock = threading.Lock()
+        self._buffer: deque[AnyKey] = deque()
+        # Presses behind every buffered key: merged auto-repeats only bump the count of the previous one.
+        self._counts: deque[int] = deque()
+        self._ready = asyncio.Event()
+        self._wakeup_pending = False
+        self._pending: deque[AnyKey] = deque()
         self._listener = None
+        self.max_depth = max_depth
+        self.overflow = overflow
+        self.merge = frozenset(merge)
+        self.dropped = 0
+        self.merged = 0
 
     def _on_press(self, key):
         if key is None:
+            from loguru import logger
+
             logger.warning('Key is None')
             return
-        self._loop.call_soon_threadsafe(self._queue.put_nowait, key)
+        with self._lock:
+            if key in self.merge and self._buffer and self._buffer[-1] == key:
+                self.merged += 1
+                self._counts[-1] += 1
+                return
+            if len(self._buffer) >= self.max_depth:
+                self.dropped += 1
+                if self.overflow == 'drop_newest':
+                    return
+                self._buffer.popleft()
+                self.dropped += self._counts.popleft() - 1
+            self._buffer.append(key)
+            self._counts.append(1)
+            if self._wakeup_pending:
+                return
+            self._wakeup_pending = True
+        # One loop wakeup per batch: later keys join the buffer until the loop drains it.
+        self._loop.call_soon_threadsafe(self._ready.set)
+
+    async def read_repeats(self) -> list[tuple[AnyKey, int]]:
+        """Как read_keys, но подряд идущие нажатия клавиш из merge приходят одной парой (клавиша, число нажатий)."""
+        if self._pending:
+            repeats = [(key, 1) for key in self._pending]
+            self._pending.clear()
+            return repeats
+        while True:
+            await self._ready.wait()
+            with self._lock:
+                self._ready.clear()
+                self._wakeup_pending = False
+                repeats = list(zip(self._buffer, self._counts))
+                self._buffer.clear()
+                self._counts.clear()
+            if repeats:
+                return repeats
+
+    async def read_keys(self) -> list[AnyKey]:
+        """Все нажатия с прошлого чтения; объединённые повторы разворачиваются обратно по своему счётчику."""
+        return [key for key, count in await self.read_repeats() for _ in range(count)]
 
     async def read_key(self) -> AnyKey:
-        return await self._queue.get()
+        if not self._pending:
+            self._pending.extend(await self.read_keys())
+        return self._pending.popleft()
 
     async def __aenter__(self):
         self._listener = Listener(on_press=self._on_press)
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from enum import Enum
+
+try:
+    from pynput.keyboard import Key, KeyCode
+except ImportError:
+    # pynput needs a display server; headless terminals get compatible stand-ins.
+    class Key(Enum):  # type: ignore[no-redef]
+        alt = 'alt'
+        backspace = 'backspace'
+        ctrl = 'ctrl'
+        delete = 'delete'
+        down = 'down'
+        end = 'end'
+        enter = 'enter'
+        esc = 'esc'
+        f1 = 'f1'
+        f2 = 'f2'
+        f3 = 'f3'
+        f4 = 'f4'
+        f5 = 'f5'
+        f6 = 'f6'
+        f7 = 'f7'
+        f8 = 'f8'
+        f9 = 'f9'
+        f10 = 'f10'
+        f11 = 'f11'
+        f12 = 'f12'
+        home = 'home'
+        insert = 'insert'
+        left = 'left'
+        page_down = 'page_down'
+        page_up = 'page_up'
+        right = 'right'
+        shift = 'shift'
+        space = 'space'
+        tab = 'tab'
+        up = 'up'
+
+        def __str__(self) -> str:
+            return f'Key.{self.name}'
+
+    class KeyCode:  # type: ignore[no-redef]
+        def __init__(self, vk: int | None = None, char: str | None = None):
+            self.vk = vk
+            self.char = char
+
+        @classmethod
+        def from_char(cls, char: str) -> KeyCode:
+            return cls(char=char)
+
+        def __eq__(self, other: object) -> bool:
+            return isinstance(other, KeyCode) and (self.vk, self.char) == (other.vk, other.char)
+
+        def __hash__(self) -> int:
+            return hash((self.vk, self.char))
+
+        def __repr__(self) -> str:
+            return repr(self.char) if self.char is not None else f'<{self.vk}>'
+
+
+AnyKey = Key | KeyCode
@@ -1,17 +1,162 @@
-from typing import TYPE_CHECKING, Callable
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import TYPE_CHECKING, Callable, Collection, Hashable, Sequence
+
+from app.core.keys import Key, KeyCode
 
 if TYPE_CHECKING:
     from app.core.input_processor import AnyKey
-    from app.core.layouts.old_abstract_layout import AbstractLayout
+    from app.core.widgets.widget import Widget
+
+Action = Callable[['Widget', 'AnyKey'], None]
 
 
 class Trigger:
-    def __init__(self, rule: Callable[[AnyKey], None], action: Callable[[AbstractLayout, AnyKey], None]):
+    def __init__(self, rule: Callable[[AnyKey], bool], action: Action):
         self.rule = rule
         self.action = action
 
 
+def _key_id(key: AnyKey | str) -> Hashable:
+    # pynput KeyCodes of the same character can differ by vk, so characters are indexed by the character itself.
+    if isinstance(key, str):
+        return key
+    if isinstance(key, KeyCode) and key.char is not None:
+        return key.char
+    return key
+
+
+class _SequenceNode:
+    __slots__ = ('action', 'next')
+
+    def __init__(self):
+        self.action: Action | None = None
+        self.next: dict[Hashable, _SequenceNode] = {}
+
+
+class Keymap:
+    """Индекс привязок: аккорды с модификаторами ищутся в словаре, клавиши и многоклавишные
+    последовательности — по префиксному дереву, произвольные правила проверяются последними.
+    """
+
+    def __init__(self, triggers: Sequence[Trigger] = ()):
+        self._chords: dict[tuple[frozenset[Key], Hashable], Action] = {}
+        self._sequences = _SequenceNode()
+        self.fallback: list[Trigger] = list(triggers)
+
+    def bind(self, keys: AnyKey | str | Sequence[AnyKey | str], action: Action, *, modifiers: Collection[Key] = ()):
+        if isinstance(keys, (Key, KeyCode)) or (isinstance(keys, str) and len(keys) == 1):
+            keys = [keys]
+        ids = [_key_id(key) for key in keys]
+        if modifiers:
+            if len(ids) != 1:
+                raise ValueError('Modifier chords bind a single key')
+            self._chords[frozenset(modifiers), ids[0]] = action
+        else:
+            # A single key is a sequence of one: bound together with 'gg', 'g' has to wait for the next key.
+            node = self._sequences
+            for key_id in ids:
+                node = node.next.setdefault(key_id, _SequenceNode())
+            node.action = action
+
+    def add_trigger(self, trigger: Trigger):
+        self.fallback.append(trigger)
+
+
 class Listener:
-    def __init__(self, triggers: list[Trigger]):
-        self.triggers = triggers
-        self.widget: AbstractLayout | None = None
+    def __init__(self, triggers: list[Trigger] | None = None, *, sequence_timeout: float = 1.0):
+        self.keymap = Keymap(triggers or [])
+        self.widget: Widget | None = None
+        self.sequence_timeout = sequence_timeout
+        self._prefix: _SequenceNode | None = None
+        self._prefix_key: AnyKey | None = None
+        self._prefix_deadline = 0.0
+        self._prefix_timer: asyncio.TimerHandle | None = None
+
+    @property
+    def triggers(self) -> list[Trigger]:
+        return self.keymap.fallback
+
+    def bind(self, keys: AnyKey | str | Sequence[AnyKey | str], action: Action, *, modifiers: Collection[Key] = ()):
+        self.keymap.bind(keys, action, modifiers=modifiers)
+
+    @property
+    def parent(self) -> Listener | None:
+        widget = self.widget._parent if self.widget is not None else None
+        while widget is not None:
+            listener = getattr(widget, 'listener', None)
+            if listener is not None:
+                return listener
+            widget = widget._parent
+        return None
+
+    def dispatch(self, key: AnyKey, modifiers: Collection[Key] = ()) -> bool:
+        """Обрабатывает клавишу этим слушателем или всплывает к слушателям родительских виджетов."""
+        listener: Listener | None = self
+        while listener is not None:
+            if listener._handle(key, frozenset(modifiers)):
+                return True
+            listener = listener.parent
+        return False
+
+    def _fire(self, action: Action, key: AnyKey) -> bool:
+        action(self.widget, key)  # type: ignore[arg-type]
+        return True
+
+    def _handle(self, key: AnyKey, modifiers: frozenset[Key]) -> bool:
+        keymap = self.keymap
+        key_id = _key_id(key)
+        now = time.monotonic()
+
+        if self._prefix is not None:
+            node = self._prefix.next.get(key_id) if now <= self._prefix_deadline and not modifiers else None
+            if node is not None:
+                self._clear_prefix()
+                return self._advance(node, key, now)
+            # The sequence stops here: a binding of the keys typed so far fires, and the key is handled anew,
+            # so whether it was handled (or has to bubble to the parent) depends on the key alone.
+            self.expire()
+
+        if modifiers:
+            action = keymap._chords.get((modifiers, key_id))
+            if action is not None:
+                return self._fire(action, key)
+        else:
+            node = keymap._sequences.next.get(key_id)
+            if node is not None:
+                return self._advance(node, key, now)
+
+        for trigger in keymap.fallback:
+            if trigger.rule(key):
+                return self._fire(trigger.action, key)
+        return False
+
+    def _advance(self, node: _SequenceNode, key: AnyKey, now: float) -> bool:
+        if not node.next:
+            return node.action is None or self._fire(node.action, key)
+        # A longer sequence may still match, so even a bound node waits for the next key or the timeout.
+        self._prefix, self._prefix_key, self._prefix_deadline = node, key, now + self.sequence_timeout
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return True
+        self._prefix_timer = loop.call_later(self.sequence_timeout, self.expire)
+        return True
+
+    def expire(self) -> bool:
+        """Завершает начатую последовательность: срабатывает привязка набранных клавиш, если она есть.
+
+        Вызывается по таймауту sequence_timeout (в запущенном цикле событий) или следующей клавишей.
+        """
+        node, key = self._prefix, self._prefix_key
+        self._clear_prefix()
+        if node is None or node.action is None:
+            return False
+        return self._fire(node.action, key)  # type: ignore[arg-type]
+
+    def _clear_prefix(self) -> None:
+        if self._prefix_timer is not None:
+            self._prefix_timer.cancel()
+        self._prefix = self._prefix_key = self._prefix_timer = None
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import asyncio
+import weakref
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import TYPE_CHECKING, Any, Callable
+
+import numpy as np
+
+from app.core.render_cache import render_cache
+from app.core.render_engine import Render
+from app.core.render_job import RenderJob, Snapshot
+from app.core.variable import tracking
+from framework.core.graphics import grapheme_table, style_table
+from framework.core.graphics.style_ids import STYLE_DTYPE
+from framework.core.profiler import profiler
+
+if TYPE_CHECKING:
+    from app.core.widgets.widget import Widget
+    from framework.core.graphics import Style
+
+
+class _Pending:
+    __slots__ = ('job', 'width', 'height', 'versions', 'future')
+
+    def __init__(self, job: RenderJob, width: int, height: int, versions: frozenset, future: Future):
+        self.job = job
+        self.width = width
+        self.height = height
+        self.versions = versions
+        self.future = future
+
+
+def _execute(
+    function: Callable[[Any, int, int], Render],
+    argument: Any,
+    snapshot: Snapshot,
+    width: int,
+    height: int,
+    shared: bool,
+):
+    # The call is pickled as a whole, so for processes snapshot is still the one argument reads through.
+    render = function(argument, width, height)
+    reads = snapshot.reads
+    if not shared:
+        return render, reads
+    # Planes go back through shared memory instead of being pickled through the result pipe.
+    text, style = render.text, render.style
+    memory = SharedMemory(create=True, size=max(text.nbytes + style.nbytes, 1))
+    try:
+        np.ndarray(text.shape, text.dtype, memory.buf)[...] = text
+        np.ndarray(style.shape, STYLE_DTYPE, memory.buf, text.nbytes)[...] = style
+    finally:
+        memory.close()
+    # The event loop process unlinks the block, so the worker's resource tracker must not count it as leaked.
+    resource_tracker.unregister(memory._name, 'shared_memory')  # type: ignore[attr-defined]
+    return (memory.name, text.shape, *_local_ids(render)), reads
+
+
+def _local_ids(render: Render) -> tuple[dict[int, Style], dict[str, str]]:
+    """Что значат id стилей и кодовые точки кластеров плоскостей в этом процессе.
+
+    Таблицы стилей и кластеров у каждого процесса свои, поэтому вместе с плоскостями
+    передаются сами стили и кластеры, а родитель интернирует их заново.
+    """
+    styles = {int(style_id): style_table[int(style_id)] for style_id in np.unique(render.style) if style_id}
+    translation = grapheme_table.translation
+    clusters = {}
+    for char in np.unique(render.text):
+        cluster = translation.get(ord(char)) if char else None
+        if cluster is not None:
+            clusters[str(char)] = cluster
+    return styles, clusters
+
+
+def _unshare(name: str, shape: tuple[int, int], styles: dict[int, Style], clusters: dict[str, str]) -> Render:
+    memory = SharedMemory(name)
+    try:
+        text = np.ndarray(shape, 'U1', memory.buf).copy()
+        style = np.ndarray(shape, STYLE_DTYPE, memory.buf, text.nbytes).copy()
+    finally:
+        memory.close()
+        memory.unlink()
+    if styles:
+        ids = np.arange(max(styles) + 1, dtype=STYLE_DTYPE)
+        for style_id, value in styles.items():
+            ids[style_id] = style_table.intern(value)
+        style = ids[style]
+    # Masks are taken first: a remapped code point may equal another one still waiting to be remapped.
+    masks = [(text == char, cluster) for char, cluster in clusters.items()]
+    for mask, cluster in masks:
+        text[mask] = grapheme_table.intern(cluster)
+    return Render(text, style)
+
+
+class RenderPool:
+    """Выполняет рендер виджетов с offload = 'thread' или 'process' вне цикла событий.
+
+    Пока рендер не готов, виджет показывает последний готовый результат или пустую заглушку.
+    Готовый результат кладётся в render_cache с версиями переменных из снимка и виджет
+    инвалидируется; результат, переменные которого успели измениться, отменяется или отбрасывается.
+    """
+
+    def __init__(self, *, threads: Executor | None = None, processes: Executor | None = None):
+        self._executors: dict[str, Executor | None] = {'thread': threads, 'process': processes}
+        self._pending: weakref.WeakKeyDictionary[Widget, _Pending] = weakref.WeakKeyDictionary()
+        self._last: weakref.WeakKeyDictionary[Widget, Render] = weakref.WeakKeyDictionary()
+
+    def configure(self, *, threads: Executor | None = None, processes: Executor | None = None) -> None:
+        """Заменяет пулы; прежние не останавливаются, этим занимается тот, кто их создал."""
+        if threads is not None:
+            self._executors['thread'] = threads
+        if processes is not None:
+            self._executors['process'] = processes
+
+    def _executor(self, kind: str) -> Executor:
+        executor = self._executors.get(kind, KeyError)
+        if executor is KeyError:
+            raise ValueError(f"Unknown offload mode {kind!r}, expected 'thread' or 'process'")
+        if executor is None:
+            executor = ThreadPoolExecutor(2, 'render') if kind == 'thread' else ProcessPoolExecutor(2)
+            self._executors[kind] = executor
+        return executor
+
+    def request(self, widget: Widget, width: int, height: int) -> Render | None:
+        """Ставит рендер в очередь и возвращает, что показать до его готовности.
+
+        Вне запущенного цикла событий возвращает None: тогда виджет рендерится как обычно.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+        versions = widget._versions()
+        pending = self._pending.get(widget)
+        if pending is None or (pending.width, pending.height, pending.versions) != (width, height, versions):
+            if pending is not None and pending.future.cancel():
+                profiler.count('offload_cancelled')
+            self._submit(loop, widget, width, height, versions)
+        last = self._last.get(widget)
+        return last if last is not None else Render.empty(width, height)
+
+    def _submit(self, loop: asyncio.AbstractEventLoop, widget: Widget, width: int, height: int, versions: frozenset):
+        kind = widget.offload
+        assert kind is not None
+        job = widget._render_job(width, height)
+        executor = self._executor(kind)
+        future = executor.submit(_execute, job.function, job.argument, job.snapshot, width, height, kind == 'process')
+        pending = self._pending[widget] = _Pending(job, width, height, versions, future)
+        profiler.count('offloaded')
+
+        def done(_: Future) -> None:
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(self._finish, widget, pending)
+
+        future.add_done_callback(done)
+
+    def _finish(self, widget: Widget, pending: _Pending) -> None:
+        future = pending.future
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            if self._pending.get(widget) is pending:
+                del self._pending[widget]
+            from loguru import logger
+
+            logger.opt(exception=error).error(f'Offloaded render of {type(widget).__name__} failed')
+            return
+        result, reads = future.result()
+        render = _unshare(*result) if widget.offload == 'process' else result
+        if self._pending.get(widget) is not pending:
+            # Superseded by a render with newer inputs; it is already queued.
+            return
+        del self._pending[widget]
+
+        job = pending.job
+        with tracking(widget):
+            for key in reads:
+                job.variables.touch(key)
+        versions = frozenset((id(job.variables), key, job.snapshot.version(key)) for key in reads)
+        render_cache.put((widget, pending.width, pending.height), versions, render)
+        self._last[widget] = render
+        # Repaints from the cache, or queues a fresh render if the variables changed in the meantime.
+        widget.invalidate()
+
+    def shutdown(self) -> None:
+        for kind, executor in self._executors.items():
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+                self._executors[kind] = None
+
+
+render_pool = RenderPool()
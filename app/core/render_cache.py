@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Hashable
+
+if TYPE_CHECKING:
+    from app.core.render_engine import Render
+
+
+class RenderCache:
+    """LRU-кэш результатов Widget._render, ограниченный суммарным числом ячеек.
+
+    На каждый ключ (виджет, ширина, высота) хранится одна запись вместе с версиями переменных,
+    из которых она построена, так что изменившаяся переменная заменяет запись, а не плодит новые.
+    """
+
+    def __init__(self, max_cells: int):
+        self.max_cells = max_cells
+        self.cells = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, tuple[Hashable, Render]] = OrderedDict()
+
+    def get(self, key: Hashable, versions: Hashable) -> Render | None:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] != versions:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def put(self, key: Hashable, versions: Hashable, render: Render) -> None:
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self.cells -= previous[1].width * previous[1].height
+        cells = render.width * render.height
+        if cells > self.max_cells:
+            return
+        self._entries[key] = (versions, render)
+        self.cells += cells
+        while self.cells > self.max_cells:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self.cells -= evicted.width * evicted.height
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.cells = 0
+
+    @property
+    def nbytes(self) -> int:
+        return sum(render.text.nbytes + render.style.nbytes for _, render in self._entries.values())
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# About 16 full 250x80 screens.
+render_cache = RenderCache(max_cells=320_000)
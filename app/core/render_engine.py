@@ -4,33 +4,50 @@ from typing import TYPE_CHECKING
 
 import numpy as np
 
+from framework.core.graphics.canvas import blit_planes, clear_planes, text_cells
+from framework.core.graphics.style_ids import STYLE_DTYPE
+
 if TYPE_CHECKING:
     from numpy.typing import NDArray
-
-    from framework.core.graphics.styles import Style
 StyledLineDefinition = str | list[tuple[str, str]] | tuple[str, dict[int, str]]
 
 
+class RenderLine:
+    text: np.ndarray
+    style: np.ndarray
+
+    def __init__(self, text: NDArray[np.str_], style: NDArray[np.uint16]):
+        self.text = text
+        self.style = style
+
+    @staticmethod
+    def from_str(text: str, style: int = 0) -> RenderLine:
+        cells = text_cells(text)
+        return RenderLine(cells, np.full(len(cells), style, dtype=STYLE_DTYPE))
+
+    def __len__(self) -> int:
+        return len(self.text)
+
+
 class Render:
     text: np.ndarray
     style: np.ndarray
 
-    def __init__(self, text: NDArray[np.str_], styles: NDArray[np.object_]):
+    def __init__(self, text: NDArray[np.str_], styles: NDArray[np.uint16], x: int = 0, y: int = 0):
         self.text = text
         self.style = styles
+        # Frame coordinates of the top left cell: non-zero for views made by clip(). Drawing into a Render
+        # takes frame coordinates, so widgets paint the same way into a whole frame and into a part of it.
+        self.x = x
+        self.y = y
 
     @staticmethod
-    def from_lines(lines: list[RenderLine]):
-        max_len = max(len(line) for line in lines)
-        padded_text_lines = []
-        for line in lines:
-            pad_len = max_len - len(line)
-            if pad_len > 0:
-                line = np.append(line.text, [' '] * pad_len)
-            padded_text_lines.append(line)
-        text = np.vstack(padded_text_lines)
-        styles = np.vstack([line.style for line in lines])
-        return Render(text, styles)
+    def from_lines(lines: list[RenderLine]) -> Render:
+        render = Render.empty(max(map(len, lines), default=0), len(lines))
+        for row, line in enumerate(lines):
+            render.text[row, : len(line)] = line.text
+            render.style[row, : len(line)] = line.style
+        return render
 
     @property
     def height(self) -> int:
@@ -41,10 +58,18 @@ class Render:
         return self.text.shape[1]
 
     @staticmethod
-    def empty(width: int, height: int) -> Render:
+    def empty(width: int, height: int, x: int = 0, y: int = 0) -> Render:
         text = np.full((height, width), ' ', dtype='U1')
-        styles = np.full((height, width), None, dtype=object)
-        return Render(text, styles)
+        styles = np.zeros((height, width), dtype=STYLE_DTYPE)
+        return Render(text, styles, x, y)
+
+    def clip(self, x: int, y: int, width: int, height: int) -> Render:
+        """Вид на прямоугольник (в координатах кадра) без копирования: всё, что рисуется в него, обрезается."""
+        left, top = max(x - self.x, 0), max(y - self.y, 0)
+        right, bottom = max(min(x + width - self.x, self.width), left), max(min(y + height - self.y, self.height), top)
+        return Render(
+            self.text[top:bottom, left:right], self.style[top:bottom, left:right], self.x + left, self.y + top
+        )
 
     def overlay(self, other: Render, x: int = 0, y: int = 0) -> Render:
         if (
@@ -55,8 +80,24 @@ class Render:
         ):
             raise ValueError('Overlay dimensions out of bounds')
 
-        new_text = np.copy(self.text)
-        new_styles = np.copy(self.style)
-        new_text[y : y + other.height, x : x + other.width] = other.text
-        new_styles[y : y + other.height, x : x + other.width] = other.style
-        return Render(new_text, new_styles)
+        return other.blit_into(Render(np.copy(self.text), np.copy(self.style)), x, y, clip=False)
+
+    def blit_into(self, target: Render, x: int = 0, y: int = 0, clip: bool = True) -> Render:
+        blit_planes(self.text, self.style, target.text, target.style, x - target.x, y - target.y, clip)
+        return target
+
+    def put_line(self, line: RenderLine, x: int, y: int, length: int | None = None) -> None:
+        """Рисует первые length ячеек строки с позиции (x, y) в координатах кадра."""
+        length = len(line) if length is None else length
+        blit_planes(line.text[None, :length], line.style[None, :length], self.text, self.style, x - self.x, y - self.y)
+
+    def clear(
+        self, x: int | None = None, y: int | None = None, width: int | None = None, height: int | None = None
+    ) -> None:
+        """Очищает прямоугольник в координатах кадра, по умолчанию — весь Render."""
+        left = 0 if x is None else x - self.x
+        top = 0 if y is None else y - self.y
+        right = self.width if width is None else left + width
+        bottom = self.height if height is None else top + height
+        left, top = max(left, 0), max(top, 0)
+        clear_planes(self.text, self.style, left, top, right - left, bottom - top)
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable, NamedTuple
+
+if TYPE_CHECKING:
+    from app.core.render_engine import Render
+    from app.core.variable import Variables
+
+
+class Snapshot:
+    """Копия Variables для рендера вне цикла событий: значения, их версии и прочитанные ключи.
+
+    Значения копируются поверхностно: изменяемые объекты в переменных не должны меняться на месте.
+    """
+
+    def __init__(self, variables: Variables):
+        self._values = {key: variable.value for key, variable in variables._variables.items()}
+        self.versions = {key: variable.version for key, variable in variables._variables.items()}
+        self.reads: set[str] = set()
+
+    def get(self, key: str) -> Any | None:
+        self.reads.add(key)
+        return self._values.get(key)
+
+    def touch(self, key: str) -> None:
+        self.reads.add(key)
+
+    def version(self, key: str) -> int:
+        return self.versions.get(key, -1)
+
+    def __getitem__(self, key: str) -> Any:
+        return self.get(key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._values
+
+
+class RenderJob(NamedTuple):
+    """Рендер, готовый к выполнению в пуле: function(argument, width, height) -> Render.
+
+    snapshot — снимок variables, через который function читает переменные. Для пула процессов
+    function и argument должны сериализоваться pickle (например, renderer объявлен на уровне модуля).
+    """
+
+    function: Callable[[Any, int, int], Render]
+    argument: Any
+    snapshot: Snapshot
+    variables: Variables
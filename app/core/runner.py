@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Callable
+
+from app.core.terminal_writer import TerminalWriter
+from framework.core.graphics import Screen
+
+if TYPE_CHECKING:
+    from app.core.input_processor import AnyKey, InputProcessor
+    from app.core.widgets import RootWidget
+
+
+class FrameStats:
+    def __init__(self):
+        self.frames = 0
+        self.skipped = 0
+        self.late = 0
+        self.dropped = 0
+        self.keys = 0
+        self.bytes = 0
+
+
+def _log_late_frame(duration: float, missed: int) -> None:
+    # loguru is imported on the first late frame rather than with the module: it is slow to import.
+    from loguru import logger
+
+    logger.debug(f'Frame took {duration * 1000:.1f} ms, {missed} frame(s) dropped')
+
+
+class AppRunner:
+    """Цикл кадров: копит нажатия между кадрами, применяет их пачкой и рисует не чаще fps раз в секунду.
+
+    Если после обработки клавиш ничего не инвалидировано, кадр пропускается целиком.
+    """
+
+    def __init__(
+        self,
+        root: RootWidget,
+        input_processor: InputProcessor,
+        on_keys: Callable[[list[AnyKey]], bool | None],
+        *,
+        screen: Screen | TerminalWriter | None = None,
+        fps: float = 30,
+    ):
+        self.root = root
+        self.input_processor = input_processor
+        self.on_keys = on_keys
+        self.screen = screen if screen is not None else Screen()
+        self.frame_interval = 1 / fps
+        self.stats = FrameStats()
+        self._keys: list[AnyKey] = []
+        self._wake = asyncio.Event()
+        self._running = False
+
+    def request_frame(self) -> None:
+        self._wake.set()
+
+    def stop(self) -> None:
+        self._running = False
+        self._wake.set()
+
+    async def _collect_keys(self) -> None:
+        while True:
+            keys = await self.input_processor.read_keys()
+            self._keys.extend(keys)
+            self._wake.set()
+
+    async def run(self) -> None:
+        loop = asyncio.get_running_loop()
+        self.root.on_dirty = self.request_frame
+        collector = asyncio.create_task(self._collect_keys())
+        self._running = True
+        # The first frame is drawn right away instead of waiting for a key or an invalidation.
+        self.request_frame()
+        next_frame = loop.time()
+        try:
+            if isinstance(self.screen, TerminalWriter):
+                self.screen.start()
+            while self._running:
+                await self._wake.wait()
+                delay = next_frame - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                if not self._running:
+                    break
+
+                keys, self._keys = self._keys, []
+                self.stats.keys += len(keys)
+                if keys and self.on_keys(keys) is False:
+                    break
+                # Cleared only now: invalidations made by on_keys belong to this frame, not a wake of their own.
+                self._wake.clear()
+
+                start = loop.time()
+                if self.root.needs_frame:
+                    self.stats.bytes += self.root.draw(self.screen)
+                    self.stats.frames += 1
+                else:
+                    self.stats.skipped += 1
+                end = loop.time()
+
+                deadline = max(next_frame, start) + self.frame_interval
+                if end > deadline:
+                    missed = int((end - deadline) / self.frame_interval) + 1
+                    self.stats.late += 1
+                    self.stats.dropped += missed
+                    _log_late_frame(end - start, missed)
+                next_frame = max(deadline, end)
+        finally:
+            self._running = False
+            self.root.on_dirty = None
+            collector.cancel()
+            if isinstance(self.screen, TerminalWriter):
+                self.screen.close()
@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import stat
+import sys
+import time
+from collections import deque
+from typing import Iterable
+
+from framework.core.graphics import Canvas, Screen
+from framework.core.graphics.control import Control
+from framework.core.graphics.screen import Region
+from framework.core.profiler import profiler
+
+
+class WriterStats:
+    def __init__(self):
+        self.frames = 0
+        self.coalesced = 0
+        self.bytes = 0
+        # Frames the terminal did not accept in one write, so the rest waited for the descriptor.
+        self.stalls = 0
+        self._recent: deque[tuple[float, int]] = deque()
+
+    def _written(self, now: float, count: int) -> None:
+        self.bytes += count
+        self._recent.append((now, count))
+        while self._recent and now - self._recent[0][0] > 1:
+            self._recent.popleft()
+
+    @property
+    def bytes_per_second(self) -> float:
+        """Скорость вывода за последнюю секунду."""
+        now = time.monotonic()
+        return float(sum(count for moment, count in self._recent if now - moment <= 1))
+
+
+class TerminalWriter:
+    """Неблокирующий вывод кадров в терминал с обратным давлением.
+
+    Пишет в дескриптор в неблокирующем режиме и дописывает остаток по loop.add_writer,
+    так что медленный терминал (например, pty по SSH) не останавливает цикл событий.
+    Пока кадр выводится, ждёт не больше одного следующего: новые кадры заменяют ожидающий,
+    и когда терминал освободится, выводится один diff до последнего кадра.
+
+    Совместим с Screen по flush и scroll, поэтому его можно передать в RootWidget.draw и AppRunner.
+    """
+
+    def __init__(self, screen: Screen | None = None, *, fd: int | None = None, synchronized: bool = True):
+        self.screen = screen if screen is not None else Screen()
+        self.fd = sys.stdout.fileno() if fd is None else fd
+        # Wraps every frame in synchronized update sequences, so the terminal never shows half of one.
+        self.synchronized = synchronized
+        self.stats = WriterStats()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._output = bytearray()
+        self._pending: tuple[Canvas, list[Region] | None] | None = None
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._waiting = False
+        # A separate non-blocking open file description for the same terminal, see start().
+        self._nonblocking_fd: int | None = None
+
+    @property
+    def queue_depth(self) -> int:
+        """Кадры, ещё не полностью выведенные: выводимый и ожидающий, от 0 до 2."""
+        return bool(self._output) + (self._pending is not None)
+
+    def start(self) -> None:
+        """Переходит на неблокирующий вывод в запущенном цикле событий.
+
+        O_NONBLOCK относится к открытому файлу, который stdout делит с stderr, print и логами,
+        поэтому терминал открывается заново: у нового дескриптора режим свой, а fd не меняется.
+        Заново открываются только терминал и канал; в обычный файл и там, где открыть нельзя,
+        вывод остаётся блокирующим.
+        """
+        self._loop = asyncio.get_running_loop()
+        self._nonblocking_fd = _reopen_nonblocking(self.fd)
+
+    def close(self) -> None:
+        """Дописывает остаток синхронно и закрывает неблокирующий дескриптор."""
+        fd, self._nonblocking_fd = self._nonblocking_fd, None
+        if self._waiting and self._loop is not None:
+            self._loop.remove_writer(fd)
+        self._loop = None
+        self._waiting = False
+        try:
+            self._write()
+        finally:
+            if fd is not None:
+                os.close(fd)
+
+    async def drain(self) -> None:
+        """Ждёт, пока все кадры будут выведены."""
+        await self._idle.wait()
+
+    def scroll(self, top: int, bottom: int, delta: int) -> None:
+        # Screen queues the scroll before the next diff, which is also the order in which it is written.
+        self.screen.scroll(top, bottom, delta)
+
+    def invalidate(self) -> None:
+        self.screen.invalidate()
+
+    def flush(self, canvas: Canvas, regions: Iterable[Region] | None = None) -> int:
+        """Выводит кадр или откладывает его, если терминал ещё не принял предыдущий.
+
+        Возвращает число байт, отданных в вывод сейчас; отложенный кадр возвращает 0.
+        """
+        regions = None if regions is None else list(regions)
+        if self._output:
+            if self._pending is not None:
+                self.stats.coalesced += 1
+                profiler.count('frames_coalesced')
+                regions = _union(self._pending[1], regions)
+            # The canvas is usually the root's frame buffer, which the next frame paints over in place.
+            self._pending = (Canvas(canvas.text.copy(), canvas.style.copy()), regions)
+            return 0
+        queued = self._encode(canvas, regions)
+        self._write()
+        return queued
+
+    def _take_pending(self) -> tuple[Canvas, list[Region] | None]:
+        pending, self._pending = self._pending, None
+        assert pending is not None
+        return pending
+
+    def _encode(self, canvas: Canvas, regions: list[Region] | None) -> int:
+        output = self.screen.update(canvas, regions)
+        if not output:
+            return 0
+        if self.synchronized:
+            output = Control.begin_synchronized_update() + output + Control.end_synchronized_update()
+        encoded = output.encode()
+        self._output += encoded
+        self.stats.frames += 1
+        if profiler.enabled:
+            profiler.count('bytes_flushed', len(encoded))
+        return len(encoded)
+
+    def _write(self) -> None:
+        fd = self.fd if self._nonblocking_fd is None else self._nonblocking_fd
+        while self._output or self._pending is not None:
+            if not self._output:
+                self._encode(*self._take_pending())
+                continue
+            try:
+                written = os.write(fd, self._output)
+            except BlockingIOError:
+                written = 0
+            if written:
+                self.stats._written(time.monotonic(), written)
+                del self._output[:written]
+            if self._output:
+                if self._loop is None or self._nonblocking_fd is None:
+                    # A blocking descriptor: the next write waits by itself.
+                    continue
+                if not self._waiting:
+                    self._waiting = True
+                    self._idle.clear()
+                    self.stats.stalls += 1
+                    self._loop.add_writer(fd, self._write)
+                return
+        if self._waiting:
+            self._waiting = False
+            self._loop.remove_writer(fd)
+        self._idle.set()
+
+
+def _reopen_nonblocking(fd: int) -> int | None:
+    if os.name != 'posix':
+        return None
+    if os.isatty(fd):
+        path = os.ttyname(fd)
+    elif stat.S_ISFIFO(os.fstat(fd).st_mode):
+        # /proc/self/fd also reopens pipes, which have no path of their own.
+        path = f'/proc/self/fd/{fd}'
+    else:
+        # A new description of a regular file starts at offset 0 without O_APPEND and would overwrite it;
+        # files never block anyway.
+        return None
+    try:
+        return os.open(path, os.O_WRONLY | os.O_NOCTTY | os.O_NONBLOCK)
+    except OSError:
+        return None
+
+
+def _union(first: list[Region] | None, second: list[Region] | None) -> list[Region] | None:
+    if first is None or second is None:
+        return None
+    return first + second
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import asyncio
+import codecs
+import os
+import re
+import sys
+import termios
+import tty
+from collections import deque
+
+from app.core.keys import AnyKey, Key, KeyCode
+from app.core.tools import _csi_input_regex
+
+# (final byte, first parameter) -> key; parameters beyond the first (xterm modifiers) are ignored.
+_CSI_KEYS: dict[tuple[str, int | None], Key] = {
+    ('A', None): Key.up,
+    ('B', None): Key.down,
+    ('C', None): Key.right,
+    ('D', None): Key.left,
+    ('H', None): Key.home,
+    ('F', None): Key.end,
+    ('A', 1): Key.up,
+    ('B', 1): Key.down,
+    ('C', 1): Key.right,
+    ('D', 1): Key.left,
+    ('H', 1): Key.home,
+    ('F', 1): Key.end,
+    ('~', 1): Key.home,
+    ('~', 2): Key.insert,
+    ('~', 3): Key.delete,
+    ('~', 4): Key.end,
+    ('~', 5): Key.page_up,
+    ('~', 6): Key.page_down,
+    ('~', 7): Key.home,
+    ('~', 8): Key.end,
+    ('~', 15): Key.f5,
+    ('~', 17): Key.f6,
+    ('~', 18): Key.f7,
+    ('~', 19): Key.f8,
+    ('~', 20): Key.f9,
+    ('~', 21): Key.f10,
+    ('~', 23): Key.f11,
+    ('~', 24): Key.f12,
+    ('P', 1): Key.f1,
+    ('Q', 1): Key.f2,
+    ('R', 1): Key.f3,
+    ('S', 1): Key.f4,
+}
+_SS3_KEYS: dict[str, Key] = {
+    'A': Key.up,
+    'B': Key.down,
+    'C': Key.right,
+    'D': Key.left,
+    'H': Key.home,
+    'F': Key.end,
+    'P': Key.f1,
+    'Q': Key.f2,
+    'R': Key.f3,
+    'S': Key.f4,
+}
+_CHAR_KEYS: dict[str, Key] = {
+    '\r': Key.enter,
+    '\n': Key.enter,
+    '\t': Key.tab,
+    '\x7f': Key.backspace,
+    '\x08': Key.backspace,
+    ' ': Key.space,
+}
+_incomplete_csi_regex = re.compile(r'\033\[[\d;]*')
+
+
+class KeyDecoder:
+    """Инкрементально разбирает байты из терминала в клавиши.
+
+    Незавершённая escape-последовательность остаётся в буфере до следующего feed
+    или до flush (по таймауту), после чего одиночный ESC считается клавишей Esc.
+    """
+
+    def __init__(self):
+        self._utf8 = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        self._text = ''
+
+    @property
+    def pending(self) -> bool:
+        return bool(self._text)
+
+    def feed(self, data: bytes) -> list[AnyKey]:
+        self._text += self._utf8.decode(data)
+        return self._decode(final=False)
+
+    def flush(self) -> list[AnyKey]:
+        return self._decode(final=True)
+
+    def _decode(self, final: bool) -> list[AnyKey]:
+        text = self._text
+        keys: list[AnyKey] = []
+        i = 0
+        while i < len(text):
+            char = text[i]
+            if char != '\033':
+                keys.append(_CHAR_KEYS.get(char) or KeyCode.from_char(char))
+                i += 1
+                continue
+
+            match = _csi_input_regex.match(text, i)
+            if match is not None:
+                params = match.group(1)
+                first = int(params.split(';')[0]) if params else None
+                key = _CSI_KEYS.get((match.group(3), first))
+                if key is not None:
+                    keys.append(key)
+                i = match.end()
+                continue
+            if text.startswith('\033O', i) and i + 2 < len(text):
+                key = _SS3_KEYS.get(text[i + 2])
+                if key is not None:
+                    keys.append(key)
+                    i += 3
+                    continue
+            incomplete = text[i:] in ('\033', '\033O') or _incomplete_csi_regex.fullmatch(text, i) is not None
+            if incomplete and not final:
+                break
+            keys.append(Key.esc)
+            i += 1
+        self._text = text[i:]
+        return keys
+
+
+class TerminalInputProcessor:
+    """Ввод с TTY без потоков: терминал в raw-режиме, stdin зарегистрирован в цикле через add_reader.
+
+    Повторяет API InputProcessor (read_key / read_keys, async with).
+    """
+
+    def __init__(self, fd: int | None = None, *, escape_timeout: float = 0.05, max_depth: int = 4096):
+        self._fd = sys.stdin.fileno() if fd is None else fd
+        self._loop = asyncio.get_event_loop()
+        self._decoder = KeyDecoder()
+        self._buffer: deque[AnyKey] = deque(maxlen=max_depth)
+        self._ready = asyncio.Event()
+        self._escape_timer: asyncio.TimerHandle | None = None
+        self._saved_attrs: list | None = None
+        self._was_blocking = True
+        self.escape_timeout = escape_timeout
+
+    def _push(self, keys: list[AnyKey]) -> None:
+        if keys:
+            self._buffer.extend(keys)
+            self._ready.set()
+
+    def _on_readable(self) -> None:
+        try:
+            data = os.read(self._fd, 4096)
+        except (BlockingIOError, InterruptedError):
+            return
+        if not data:
+            self._loop.remove_reader(self._fd)
+            return
+        if self._escape_timer is not None:
+            self._escape_timer.cancel()
+            self._escape_timer = None
+        self._push(self._decoder.feed(data))
+        if self._decoder.pending:
+            self._escape_timer = self._loop.call_later(self.escape_timeout, self._on_escape_timeout)
+
+    def _on_escape_timeout(self) -> None:
+        self._escape_timer = None
+        self._push(self._decoder.flush())
+
+    async def read_keys(self) -> list[AnyKey]:
+        while not self._buffer:
+            self._ready.clear()
+            await self._ready.wait()
+        keys = list(self._buffer)
+        self._buffer.clear()
+        return keys
+
+    async def read_key(self) -> AnyKey:
+        while not self._buffer:
+            self._ready.clear()
+            await self._ready.wait()
+        return self._buffer.popleft()
+
+    async def __aenter__(self):
+        if os.isatty(self._fd):
+            self._saved_attrs = termios.tcgetattr(self._fd)
+            tty.setraw(self._fd)
+        self._was_blocking = os.get_blocking(self._fd)
+        os.set_blocking(self._fd, False)
+        self._loop.add_reader(self._fd, self._on_readable)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self._loop.remove_reader(self._fd)
+        if self._escape_timer is not None:
+            self._escape_timer.cancel()
+        os.set_blocking(self._fd, self._was_blocking)
+        if self._saved_attrs is not None:
+            termios.tcsetattr(self._fd, termios.TCSADRAIN, self._saved_attrs)
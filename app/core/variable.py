@@ -1,10 +1,32 @@
-from typing import Any
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Iterator
+
+if TYPE_CHECKING:
+    from app.core.widgets.widget import Widget
+
+# Widgets that are currently rendering; reads of Variables are attributed to the innermost one.
+_readers: list[Widget] = []
+
+
+@contextmanager
+def tracking(widget: Widget) -> Iterator[None]:
+    for variables, key in widget._reads:
+        variables._forget(key, widget)
+    widget._reads.clear()
+    _readers.append(widget)
+    try:
+        yield
+    finally:
+        _readers.pop()
 
 
 class VariableValue:
     def __init__(self, value: Any):
         self._value = value
         self._changed = True
+        self._version = 0
 
     @property
     def value(self) -> Any:
@@ -14,35 +36,63 @@ class VariableValue:
     def value(self, value: Any) -> None:
         if self._value != value:
             self._changed = True
+            self._version += 1
             self._value = value
 
     @property
     def changed(self) -> bool:
         return self._changed
 
+    @property
+    def version(self) -> int:
+        return self._version
+
     def _reset(self) -> None:
         self._changed = False
 
     def invalidate(self) -> None:
         self._changed = True
+        self._version += 1
 
 
 class Variables:
     def __init__(self):
         self._variables: dict[str, VariableValue] = {}
+        self._dependents: dict[str, set[Widget]] = {}
 
     def _raw_get(self, key: str) -> VariableValue | None:
         return self._variables.get(key)
 
     def get(self, key: str) -> Any | None:
+        self.touch(key)
         var = self._variables.get(key)
         return var if var is None else var.value
 
     def set(self, key: str, value: Any) -> None:
         if key not in self._variables:
             self._variables[key] = VariableValue(value)
-        else:
+        elif self._variables[key].value != value:
             self._variables[key].value = value
+        else:
+            return
+        for widget in tuple(self._dependents.get(key, ())):
+            widget.invalidate()
+
+    def version(self, key: str) -> int:
+        var = self._variables.get(key)
+        return -1 if var is None else var.version
+
+    def touch(self, key: str) -> None:
+        """Records that the currently rendering widget depends on key without reading it."""
+        if _readers:
+            widget = _readers[-1]
+            self._dependents.setdefault(key, set()).add(widget)
+            widget._reads.add((self, key))
+
+    def _forget(self, key: str, widget: Widget) -> None:
+        dependents = self._dependents.get(key)
+        if dependents is not None:
+            dependents.discard(widget)
 
     def _reset(self) -> None:
         for variable in self._variables.values():
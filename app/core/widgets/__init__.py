@@ -1,9 +1,36 @@
-from ..layouts.old_abstract_layout import AbstractLayout
-from .data_box import DataBox
-from .padding import Area
+from typing import TYPE_CHECKING
+
+from framework.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .data_box import DataBox
+    from .layers import Layers
+    from .list_view import ListView
+    from .padding import Padding
+    from .profiler_hud import ProfilerHud
+    from .root_widget import RootWidget
+    from .widget import Widget
+
+# Exported names are imported from their modules on first access.
+_exports = {
+    'DataBox': '.data_box',
+    'Layers': '.layers',
+    'ListView': '.list_view',
+    'Padding': '.padding',
+    'ProfilerHud': '.profiler_hud',
+    'RootWidget': '.root_widget',
+    'Widget': '.widget',
+}
 
 __all__ = [
-    'AbstractLayout',
-    'Area',
     'DataBox',
+    'Layers',
+    'ListView',
+    'Padding',
+    'ProfilerHud',
+    'RootWidget',
+    'Widget',
 ]
+
+
+__getattr__, __dir__ = lazy_exports(globals(), _exports)
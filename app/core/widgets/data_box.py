@@ -1,29 +1,79 @@
 from __future__ import annotations
 
+from functools import partial
 from typing import TYPE_CHECKING, Any, Callable
 
-from app.core.layouts.old_abstract_layout import AbstractLayout
+from app.core.render_engine import Render, RenderLine
+from app.core.render_job import RenderJob, Snapshot
+from app.core.variable import Variables
+from app.core.widgets.widget import Widget
 
 if TYPE_CHECKING:
     from app.core.listener import Listener
-    from app.core.render_engine import StyledLine
 
 
-class DataBox(AbstractLayout):
+class DataBox(Widget):
+    cacheable = True
+
     def __init__(
         self,
         *,
-        renderer: Callable[[DataBox, int, int], list[StyledLine]],
+        renderer: Callable[[DataBox, int, int], list[RenderLine | str]],
         id: str | None = None,
-        variables: dict[str, Any] | None = None,
+        variables: Variables | dict[str, Any] | None = None,
         depends_on: list[str] | None = None,
         listener: Listener | None = None,
         width: int | None = None,
         height: int | None = None,
-        children: list[Child] | None = None,
+        children: list[Widget] | None = None,
+        offload: str | None = None,
     ):
-        super().__init__(id=id, variables=variables, depends_on=depends_on, listener=listener, width=width, height=height, children=children)
+        super().__init__()
+        if not isinstance(variables, Variables):
+            initial = variables or {}
+            variables = Variables()
+            for key, value in initial.items():
+                variables.set(key, value)
+        self.id = id
+        self.variables = variables
+        self.listener = listener
+        if listener is not None:
+            listener.widget = self
+        self.width = width
+        self.height = height
+        self.children = [self._adopt(child) for child in children or []]
         self._renderer = renderer
+        self._depends_on = depends_on or []
+        # A slow renderer ('thread' for IO, 'process' for CPU) runs off the event loop on a snapshot of the box.
+        self.offload = offload
+
+    def _render(self, width: int, height: int) -> Render:
+        return _render_box(self._renderer, self._depends_on, self, width, height)
+
+    def _render_job(self, width: int, height: int) -> RenderJob:
+        snapshot = DataBoxSnapshot(self)
+        function = partial(_render_box, self._renderer, self._depends_on)
+        return RenderJob(function, snapshot, snapshot.variables, self.variables)
+
+
+class DataBoxSnapshot:
+    """Что видит renderer при рендере вне цикла событий: id, размеры и снимок переменных DataBox."""
+
+    def __init__(self, box: DataBox):
+        self.id = box.id
+        self.width = box.width
+        self.height = box.height
+        self.variables = Snapshot(box.variables)
+
 
-    def _render(self, width: int, height: int) -> list[StyledLine]:
-        return self._renderer(self, width, height)
+def _render_box(
+    renderer: Callable[[Any, int, int], list[RenderLine | str]],
+    depends_on: list[str],
+    box: DataBox | DataBoxSnapshot,
+    width: int,
+    height: int,
+) -> Render:
+    for key in depends_on:
+        box.variables.touch(key)
+    lines = renderer(box, width, height)
+    return Render.from_lines([RenderLine.from_str(line) if isinstance(line, str) else line for line in lines])
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from typing import override
+
+from app.core.compositor import Compositor, Layer
+from app.core.render_engine import Render
+from app.core.widgets.widget import Rect, Widget
+
+
+class Layers(Widget):
+    """Виджеты друг над другом, например всплывающая подсказка над панелью.
+
+    Закрытые непрозрачными слоями виджеты не отрисовываются, поэтому открытие подсказки
+    над тяжёлой панелью не перерисовывает панель: в кадр попадает только подсказка.
+    """
+
+    composites = True
+
+    def __init__(self, *, layers: list[Layer] | None = None):
+        super().__init__()
+        self._compositor = Compositor()
+        for layer in layers or []:
+            self.add(layer)
+
+    @property
+    def layers(self) -> list[Layer]:
+        return self._compositor.layers
+
+    def add(self, layer: Layer | Widget, *, rect: Rect | None = None, z: int = 0, opaque: bool = True) -> Layer:
+        if isinstance(layer, Widget):
+            layer = Layer(layer, rect=rect, z=z, opaque=opaque)
+        self._adopt(layer.widget)
+        self._compositor.add(layer)
+        self._damage(layer)
+        return layer
+
+    def remove(self, layer: Layer) -> None:
+        self._compositor.remove(layer)
+        layer.widget._parent = None
+        self._damage(layer)
+
+    def _damage(self, layer: Layer) -> None:
+        if self._rect is None or layer.rect is None:
+            self.invalidate()
+            return
+        # Only the layer's own rectangle changes; the root repaints it through the compositor.
+        x, y = self._rect[:2]
+        self._root()._schedule_rect((x + layer.rect[0], y + layer.rect[1], *layer.rect[2:]), self)
+
+    @override
+    def _render(self, width: int, height: int) -> Render:
+        r = Render.empty(width, height)
+        self._render_into(r, 0, 0, width, height)
+        return r
+
+    @override
+    def _render_into(self, target: Render, x: int, y: int, width: int, height: int) -> None:
+        self._compositor.composite(target, (x, y, width, height))
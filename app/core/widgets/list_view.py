@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Callable, override
+
+from app.core.render_engine import Render, RenderLine
+from app.core.widgets.widget import Rect, Widget
+
+
+class ListView(Widget):
+    """Виртуальный список: строит и рисует только строки, попадающие в видимую область.
+
+    Построенные строки кэшируются, а прокрутка передаётся корню как подсказка,
+    чтобы сдвинуть уже выведенное содержимое средствами терминала, а не перерисовывать его.
+    """
+
+    def __init__(
+        self,
+        *,
+        row_count: int,
+        row_builder: Callable[[int, int], RenderLine | str],
+        cached_rows: int = 1024,
+    ):
+        super().__init__()
+        self._row_count = row_count
+        self._row_builder = row_builder
+        self._cached_rows = cached_rows
+        self._rows: OrderedDict[tuple[int, int], RenderLine] = OrderedDict()
+        self._offset = 0
+        self._height = 0
+        self._pending_scroll = 0
+        self._drawn_rect: Rect | None = None
+
+    @property
+    def offset(self) -> int:
+        return self._offset
+
+    @property
+    def row_count(self) -> int:
+        return self._row_count
+
+    def scroll_to(self, offset: int) -> None:
+        offset = max(0, min(offset, self._row_count - self._height))
+        if offset != self._offset:
+            self._pending_scroll += offset - self._offset
+            self._offset = offset
+            self.invalidate()
+
+    def scroll_by(self, delta: int) -> None:
+        self.scroll_to(self._offset + delta)
+
+    def set_row_count(self, row_count: int) -> None:
+        self._row_count = row_count
+        self._rows.clear()
+        self._pending_scroll = 0
+        self.scroll_to(self._offset)
+        self.invalidate()
+
+    def invalidate_rows(self) -> None:
+        self._rows.clear()
+        self._pending_scroll = 0
+        self.invalidate()
+
+    def _row(self, index: int, width: int) -> RenderLine:
+        key = (index, width)
+        line = self._rows.get(key)
+        if line is None:
+            line = self._row_builder(index, width)
+            if isinstance(line, str):
+                line = RenderLine.from_str(line)
+            self._rows[key] = line
+            if len(self._rows) > self._cached_rows:
+                self._rows.popitem(last=False)
+        else:
+            self._rows.move_to_end(key)
+        return line
+
+    @override
+    def _render(self, width: int, height: int) -> Render:
+        r = Render.empty(width, height)
+        self._render_into(r, 0, 0, width, height)
+        return r
+
+    @override
+    def _render_into(self, target: Render, x: int, y: int, width: int, height: int) -> None:
+        self._height = height
+        for row in range(min(height, self._row_count - self._offset)):
+            line = self._row(self._offset + row, width)
+            target.put_line(line, x, y + row, min(len(line), width))
+
+        rect = (x, y, width, height)
+        delta, self._pending_scroll = self._pending_scroll, 0
+        if delta and abs(delta) < height and self._drawn_rect == rect:
+            self._root()._request_scroll(rect, delta)
+        self._drawn_rect = rect
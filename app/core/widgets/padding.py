@@ -1,10 +1,8 @@
-from typing import TYPE_CHECKING, override
+from typing import override
 
+from app.core.render_engine import Render
 from app.core.widgets.widget import Widget
 
-if TYPE_CHECKING:
-    from app.core.widgets.widget import Render, Widget
-
 
 class Padding(Widget):
     def __init__(
@@ -16,19 +14,21 @@ class Padding(Widget):
         left: int = 0,
         child: Widget,
     ):
+        super().__init__()
         self._top = top
         self._right = right
         self._bottom = bottom
         self._left = left
-        self._child = child
+        self._child = self._adopt(child)
 
     @override
     def _render(self, width: int, height: int) -> Render:
-        child_width = width - self._left - self._right
-        child_height = height - self._top - self._bottom
-
-        child_render = self._child._render(child_width, child_height)
-
         r = Render.empty(width, height)
-        r.overlay(child_render, self._left, self._top)
+        self._render_into(r, 0, 0, width, height)
         return r
+
+    @override
+    def _render_into(self, target: Render, x: int, y: int, width: int, height: int) -> None:
+        child_width = width - self._left - self._right
+        child_height = height - self._top - self._bottom
+        self._child._paint(target, x + self._left, y + self._top, child_width, child_height)
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from collections import deque
+from typing import override
+
+import numpy as np
+
+from app.core.render_engine import Render, RenderLine
+from app.core.widgets.widget import Widget
+from framework.core.graphics import Styles, style_table
+from framework.core.profiler import FrameProfile, Profiler, profiler
+
+
+class ProfilerHud(Widget):
+    """Панель со статистикой профайлера поверх кадра (RootWidget(hud=...)).
+
+    Показывает предыдущий кадр: время, p99 за последние history кадров, попадания в кэш,
+    число изменённых ячеек, выведенные байты и самые медленные виджеты.
+    """
+
+    def __init__(self, *, source: Profiler = profiler, width: int = 36, top: int = 4, history: int = 120):
+        super().__init__()
+        self.width = width
+        self.height = 4 + top
+        self._top = top
+        self._durations: deque[float] = deque(maxlen=history)
+        self._last: FrameProfile | None = None
+        self.unsubscribe = source.subscribe(self._record)
+
+    def _record(self, frame: FrameProfile) -> None:
+        self._durations.append(frame.duration)
+        self._last = frame
+
+    @override
+    def _render(self, width: int, height: int) -> Render:
+        frame = self._last
+        if frame is None:
+            lines = ['waiting for a frame']
+        else:
+            p99 = float(np.percentile(self._durations, 99))
+            hit_rate = frame.cache_hit_rate
+            lines = [
+                f'frame {frame.duration * 1e3:6.2f} ms  p99 {p99 * 1e3:6.2f} ms',
+                f'cache {"-" if hit_rate is None else f"{hit_rate:.0%}":>4}'
+                f'  cells {frame.counters.get("cells_changed", 0)}',
+                f'flushed {frame.counters.get("bytes_flushed", 0)} B',
+                'slowest renders:',
+            ]
+            lines += [
+                f'  {name[: width - 13]:<{width - 13}} {seconds * 1e3:6.2f} ms'
+                for name, seconds in frame.totals()[: self._top]
+            ]
+        style = style_table.intern(Styles.INVERSE)
+        return Render.from_lines(
+            [RenderLine.from_str(line[:width].ljust(width), style) for line in lines[:height]]
+            + [RenderLine.from_str(' ' * width, style)] * max(height - len(lines), 0)
+        )
@@ -1,16 +1,128 @@
+from __future__ import annotations
+
 import os
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable
 
-from app.core.widgets.widget import Widget
+from app.core.render_engine import Render
+from app.core.widgets.widget import Rect, Widget
+from framework.core.graphics import Canvas, Screen
+from framework.core.profiler import profiler
 
 if TYPE_CHECKING:
-    from app.core.widgets.widget import Render
+    from app.core.terminal_writer import TerminalWriter
 
 
 class RootWidget(Widget):
-    def __init__(self, *, child: Widget):
-        self._child = child
+    def __init__(self, *, child: Widget, size: tuple[int, int] | None = None, hud: Widget | None = None):
+        super().__init__()
+        self._child = self._adopt(child)
+        # Fixed frame size for headless rendering; None follows the terminal.
+        self.size = size
+        # Painted over the top right corner on every drawn frame, e.g. ProfilerHud.
+        self.hud = hud
+        self._frame: Render | None = None
+        self._dirty_widgets: set[Widget] = set()
+        # Parts of a widget's rectangle to repaint although the widget itself is not dirty, e.g. a closed popup.
+        self._damaged: list[tuple[Rect, Widget]] = []
+        self._scrolls: list[tuple[Rect, int]] = []
+        self.on_dirty: Callable[[], None] | None = None
+
+    def _schedule(self, widget: Widget) -> None:
+        self._dirty_widgets.add(widget)
+        if self.on_dirty is not None:
+            self.on_dirty()
+
+    def _schedule_rect(self, rect: Rect, widget: Widget) -> None:
+        self._damaged.append((rect, widget))
+        if self.on_dirty is not None:
+            self.on_dirty()
+
+    def _request_scroll(self, rect: Rect, delta: int) -> None:
+        self._scrolls.append((rect, delta))
 
     def _render(self) -> Render:  # type: ignore
-        self._width, self._height = os.get_terminal_size()
-        return self._child._render(self._width, self._height)
+        self._width, self._height = self._frame_size()
+        if self._frame is None or (self._frame.width, self._frame.height) != (self._width, self._height):
+            self._frame = Render.empty(self._width, self._height)
+        else:
+            self._frame.clear()
+        self._dirty_widgets.clear()
+        self._damaged.clear()
+        self._rect = (0, 0, self._width, self._height)
+        self._dirty = False
+        self._child._paint(self._frame, 0, 0, self._width, self._height)
+        return self._frame
+
+    def _render_dirty(self) -> list[Rect]:
+        """Перерисовывает только инвалидированные виджеты и возвращает изменённые области кадра."""
+        size = self._frame_size()
+        if self._frame is None or (self._frame.width, self._frame.height) != size or self in self._dirty_widgets:
+            self._render()
+            return [(0, 0, self._width, self._height)]
+
+        regions = []
+        for widget in self._dirty_widgets:
+            if not widget._dirty or widget._rect is None or _has_dirty_ancestor(widget):
+                continue
+            self._repaint(widget._rect, widget)
+            regions.append(widget._rect)
+        for rect, widget in self._damaged:
+            if widget._rect is None or widget._dirty or _has_dirty_ancestor(widget):
+                continue
+            self._repaint(rect, widget)
+            regions.append(rect)
+        self._dirty_widgets.clear()
+        self._damaged.clear()
+        return regions
+
+    def _repaint(self, rect: Rect, widget: Widget) -> None:
+        # Layers above the widget may cover it, so the outermost compositor repaints the area instead:
+        # it paints only what is visible there, and nothing if the widget is hidden.
+        owner = widget
+        parent = widget._parent
+        while parent is not None:
+            if parent.composites:
+                owner = parent
+            parent = parent._parent
+        view = self._frame.clip(*rect)
+        view.clear()
+        owner._paint(view, *owner._rect)
+
+    def _frame_size(self) -> tuple[int, int]:
+        return self.size if self.size is not None else tuple(os.get_terminal_size())
+
+    @property
+    def needs_frame(self) -> bool:
+        return self._frame is None or bool(self._dirty_widgets) or bool(self._damaged)
+
+    def draw(self, screen: Screen | TerminalWriter) -> int:
+        with profiler.frame():
+            regions = self._render_dirty()
+            if not regions:
+                return 0
+            for (_, y, _, height), delta in self._scrolls:
+                screen.scroll(y, y + height, delta)
+                # The terminal scrolls whole rows, so everything else in the band has to be re-checked too.
+                regions.append((0, y, self._width, height))
+            self._scrolls.clear()
+            if self.hud is not None:
+                regions.append(self._paint_hud(self.hud))
+            return screen.flush(Canvas(self._frame.text, self._frame.style), regions)
+
+    def _paint_hud(self, hud: Widget) -> Rect:
+        width = min(getattr(hud, 'width', None) or self._width, self._width)
+        height = min(getattr(hud, 'height', None) or self._height, self._height)
+        rect = (self._width - width, 0, width, height)
+        # Repainted on every frame: widgets under the HUD may have just drawn over it.
+        self._frame.clear(*rect)
+        hud._paint(self._frame, *rect)
+        return rect
+
+
+def _has_dirty_ancestor(widget: Widget) -> bool:
+    parent = widget._parent
+    while parent is not None:
+        if parent._dirty:
+            return True
+        parent = parent._parent
+    return False
@@ -1,13 +1,122 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable, ClassVar
+
+from app.core.render_cache import render_cache
+from app.core.variable import tracking
+from framework.core.profiler import profiler
 
 if TYPE_CHECKING:
     from app.core.render_engine import Render
+    from app.core.render_job import RenderJob
+    from app.core.variable import Variables
+
+Rect = tuple[int, int, int, int]
+
+OFFLOAD_MODES = ('thread', 'process')
 
 
 class Widget(ABC):
+    # Widgets whose _render is a pure function of their size and the Variables they read.
+    cacheable: ClassVar[bool] = False
+    # Widgets that stack their children and decide which parts of them are visible, see Layers.
+    composites: ClassVar[bool] = False
+    # Defined by widgets that can render off the event loop: the render function and a snapshot of its inputs.
+    _render_job: Callable[[int, int], RenderJob]
+    _offload: str | None = None
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        if 'offload' in cls.__dict__ and not isinstance(cls.__dict__['offload'], property):
+            # offload = 'thread' in a class body would replace the property, so it is checked and stored here.
+            _check_offload(cls, cls.__dict__['offload'])
+            cls._offload = cls.__dict__['offload']
+            del cls.offload
+
+    def __init__(self) -> None:
+        self._parent: Widget | None = None
+        self._rect: Rect | None = None
+        self._dirty = True
+        self._reads: set[tuple[Variables, str]] = set()
+
     @abstractmethod
     def _render(self, width: int, height: int) -> Render:
         pass
+
+    @property
+    def offload(self) -> str | None:
+        """'thread' или 'process' для медленных кэшируемых виджетов: _render_job выполняется в render_pool."""
+        return self._offload
+
+    @offload.setter
+    def offload(self, mode: str | None) -> None:
+        _check_offload(type(self), mode)
+        self._offload = mode
+
+    def _render_into(self, target: Render, x: int, y: int, width: int, height: int) -> None:
+        self._render(width, height).blit_into(target, x, y)
+
+    def _paint(self, target: Render, x: int, y: int, width: int, height: int) -> None:
+        self._rect = (x, y, width, height)
+        self._dirty = False
+        with profiler.span(self, 'paint'):
+            if not self.cacheable:
+                with tracking(self), profiler.span(self, 'render'):
+                    self._render_into(target, x, y, width, height)
+                return
+
+            key = (self, width, height)
+            render = render_cache.get(key, self._versions())
+            if render is not None:
+                profiler.count('cache_hits')
+            else:
+                profiler.count('cache_misses')
+                if self.offload is not None:
+                    # Imported here: the pool pulls in asyncio, multiprocessing and numpy.
+                    from app.core.offload import render_pool
+
+                    # The last finished render or a placeholder; the widget is invalidated when the new one is ready.
+                    render = render_pool.request(self, width, height)
+                if render is None:
+                    with tracking(self), profiler.span(self, 'render'):
+                        render = self._render(width, height)
+                    render_cache.put(key, self._versions(), render)
+            render.blit_into(target, x, y)
+
+    def _versions(self) -> frozenset[tuple[int, str, int]]:
+        return frozenset((id(variables), key, variables.version(key)) for variables, key in self._reads)
+
+    def _adopt(self, child: Widget) -> Widget:
+        child._parent = self
+        return child
+
+    def invalidate(self) -> None:
+        if self._dirty:
+            return
+        self._dirty = True
+        self._root()._schedule(self)
+
+    def _root(self) -> Widget:
+        root = self
+        while root._parent is not None:
+            root = root._parent
+        return root
+
+    def _schedule(self, widget: Widget) -> None:
+        pass
+
+    def _schedule_rect(self, rect: Rect, widget: Widget) -> None:
+        pass
+
+    def _request_scroll(self, rect: Rect, delta: int) -> None:
+        pass
+
+
+def _check_offload(cls: type[Widget], mode: str | None) -> None:
+    if mode is None:
+        return
+    if mode not in OFFLOAD_MODES:
+        raise ValueError(f'Unknown offload mode {mode!r}, expected one of {OFFLOAD_MODES}')
+    if not cls.cacheable or not hasattr(cls, '_render_job'):
+        raise TypeError(f'{cls.__name__} cannot be rendered off the event loop: it needs cacheable and _render_job')
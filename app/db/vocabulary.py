@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+from pathlib import Path
+from typing import Iterable, Iterator, NamedTuple
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    word TEXT PRIMARY KEY,
+    folded TEXT NOT NULL,
+    translation TEXT NOT NULL,
+    rate REAL NOT NULL
+) WITHOUT ROWID;
+"""
+
+_INDEXES = """
+CREATE INDEX IF NOT EXISTS entries_folded ON entries (folded);
+CREATE INDEX IF NOT EXISTS entries_rate ON entries (rate);
+"""
+
+_DROP_INDEXES = """
+DROP INDEX IF EXISTS entries_folded;
+DROP INDEX IF EXISTS entries_rate;
+"""
+
+_UPSERT = """
+INSERT INTO entries (word, folded, translation, rate) VALUES (?, ?, ?, ?)
+ON CONFLICT (word) DO UPDATE SET translation = excluded.translation, rate = excluded.rate
+"""
+
+_COLUMNS = 'word, translation, rate'
+
+
+class Entry(NamedTuple):
+    word: str
+    translation: str
+    rate: float
+
+
+def _entry(cursor: sqlite3.Cursor, row: tuple) -> Entry:
+    return Entry(*row)
+
+
+def _prefix_end(prefix: str) -> str:
+    """Наименьшая строка больше всех строк с данным префиксом, для поиска по диапазону индекса."""
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+def _migrate(json_path: Path, sqlite_path: Path) -> None:
+    partial = sqlite_path.with_suffix('.partial.sqlite3')
+    # Leftovers of an interrupted migration, including its WAL files.
+    for path in (partial, Path(f'{partial}-wal'), Path(f'{partial}-shm')):
+        path.unlink(missing_ok=True)
+    # Closing the store checkpoints the WAL into the file, so the file alone is the complete database.
+    with VocabularyStore(partial) as store:
+        store.import_json(json_path)
+    os.replace(partial, sqlite_path)
+
+
+class VocabularyStore:
+    """Словарь {слово: перевод, рейтинг} в файле SQLite.
+
+    Открытие не читает записи: поиск по слову, префиксу и рейтингу идёт по индексам,
+    а изменения пишутся по одной записи, без перезаписи файла.
+    """
+
+    def __init__(self, path: str | Path, *, mmap_size: int = 256 * 1024 * 1024):
+        self.path = Path(path)
+        self._connection = sqlite3.connect(self.path)
+        self._connection.execute('PRAGMA journal_mode = WAL')
+        self._connection.execute('PRAGMA synchronous = NORMAL')
+        self._connection.execute(f'PRAGMA mmap_size = {int(mmap_size)}')
+        self._connection.executescript(_SCHEMA + _INDEXES)
+
+    @staticmethod
+    def from_config(config_path: str | Path) -> VocabularyStore:
+        """Открывает словарь по ключу db-path конфигурации.
+
+        Если db-path указывает на словарь в старом формате JSON, он один раз переносится
+        в файл .sqlite3 рядом с ним, и дальше используется уже этот файл. Перенос идёт во временный
+        файл, который занимает место .sqlite3 только целиком, так что прерванный перенос повторится.
+        """
+        config_path = Path(config_path)
+        with open(config_path, encoding='utf-8') as file:
+            db_path = config_path.parent / json.load(file)['db-path']
+        if db_path.suffix != '.json':
+            return VocabularyStore(db_path)
+        sqlite_path = db_path.with_suffix('.sqlite3')
+        if not sqlite_path.exists() and db_path.exists():
+            _migrate(db_path, sqlite_path)
+        return VocabularyStore(sqlite_path)
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def __enter__(self) -> VocabularyStore:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _select(self, query: str, parameters: tuple = ()) -> sqlite3.Cursor:
+        cursor = self._connection.cursor()
+        cursor.row_factory = _entry
+        return cursor.execute(query, parameters)
+
+    def get(self, word: str) -> Entry | None:
+        return self._select(f'SELECT {_COLUMNS} FROM entries WHERE word = ?', (word,)).fetchone()
+
+    def __getitem__(self, word: str) -> Entry:
+        entry = self.get(word)
+        if entry is None:
+            raise KeyError(word)
+        return entry
+
+    def __contains__(self, word: object) -> bool:
+        return self._connection.execute('SELECT 1 FROM entries WHERE word = ?', (word,)).fetchone() is not None
+
+    def __len__(self) -> int:
+        return self._connection.execute('SELECT count(*) FROM entries').fetchone()[0]
+
+    def put(self, word: str, translation: str, rate: float = 1.0) -> None:
+        with self._connection:
+            self._connection.execute(_UPSERT, (word, word.casefold(), translation, rate))
+
+    def put_many(self, entries: Iterable[Entry | tuple[str, str, float]]) -> None:
+        """Добавляет или обновляет записи одной транзакцией."""
+        with self._connection:
+            self._connection.executemany(
+                _UPSERT, ((word, word.casefold(), translation, rate) for word, translation, rate in entries)
+            )
+
+    def set_rate(self, word: str, rate: float) -> bool:
+        with self._connection:
+            return self._connection.execute('UPDATE entries SET rate = ? WHERE word = ?', (rate, word)).rowcount > 0
+
+    def delete(self, word: str) -> bool:
+        with self._connection:
+            return self._connection.execute('DELETE FROM entries WHERE word = ?', (word,)).rowcount > 0
+
+    def search(self, prefix: str, limit: int = 20) -> list[Entry]:
+        """Слова, начинающиеся с prefix без учёта регистра, по алфавиту."""
+        folded = prefix.casefold()
+        if not folded:
+            return self._select(f'SELECT {_COLUMNS} FROM entries ORDER BY folded LIMIT ?', (limit,)).fetchall()
+        query = f'SELECT {_COLUMNS} FROM entries WHERE folded >= ? AND folded < ? ORDER BY folded LIMIT ?'
+        return self._select(query, (folded, _prefix_end(folded), limit)).fetchall()
+
+    def by_rate(self, limit: int = 20, *, lowest: bool = True) -> list[Entry]:
+        """Записи с наименьшим (или наибольшим) рейтингом, например для очередного повторения."""
+        order = 'ASC' if lowest else 'DESC'
+        return self._select(f'SELECT {_COLUMNS} FROM entries ORDER BY rate {order} LIMIT ?', (limit,)).fetchall()
+
+    def __iter__(self) -> Iterator[Entry]:
+        return iter(self._select(f'SELECT {_COLUMNS} FROM entries ORDER BY word'))
+
+    def import_json(self, path: str | Path) -> int:
+        """Загружает словарь в формате {слово: {translation, rate}} и возвращает число записей."""
+        with open(path, encoding='utf-8') as file:
+            data = json.load(file)
+        entries = ((word, value['translation'], float(value.get('rate', 1.0))) for word, value in data.items())
+        if self._connection.execute('SELECT 1 FROM entries LIMIT 1').fetchone() is not None:
+            self.put_many(entries)
+            return len(data)
+        # Building the secondary indexes once after a bulk load is much faster than updating them per row.
+        self._connection.executescript(_DROP_INDEXES)
+        try:
+            self.put_many(sorted(entries))
+        finally:
+            self._connection.executescript(_INDEXES)
+        return len(data)
+
+    def export_json(self, path: str | Path) -> None:
+        data = {entry.word: {'translation': entry.translation, 'rate': entry.rate} for entry in self}
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(data, file, ensure_ascii=False, indent=4)
@@ -1,21 +1,32 @@
 import asyncio
 
-from core.input_processor import InputProcessor
 from pynput.keyboard import Key, KeyCode
 
+from app.core.input_processor import InputProcessor
+from app.core.runner import AppRunner
+from app.core.terminal_writer import TerminalWriter
+from app.core.widgets import DataBox, Padding, RootWidget
+
+
+def describe(key) -> str:
+    if isinstance(key, Key):
+        return f'Key: {key}'
+    elif isinstance(key, KeyCode):
+        return f'KeyCode: {key.char}'
+    return 'Unknown key type'
+
 
 async def main():
-    print('hewwo')
+    log = DataBox(renderer=lambda box, width, height: ['hewwo', *box.variables['lines'][-(height - 1) :]])
+    log.variables['lines'] = []
+    root = RootWidget(child=Padding(top=1, left=2, child=log))
+
+    def on_keys(keys):
+        log.variables['lines'] = [*log.variables['lines'], *map(describe, keys)]
+        return not any(isinstance(key, KeyCode) and key.char == 'q' for key in keys)
+
     async with InputProcessor() as input_processor:
-        while key := await input_processor.read_key():
-            if isinstance(key, Key):
-                print(f'Key: {key}')
-            elif isinstance(key, KeyCode):
-                print(f'KeyCode: {key.char}')
-                if key.char == 'q':
-                    break
-            else:
-                print('Unknown key type')
+        await AppRunner(root, input_processor, on_keys, screen=TerminalWriter(), fps=30).run()
 
 
 if __name__ == '__main__':
@@ -34,7 +34,3 @@ frame = DataBox(
     id='frame',
     depends_on=['width', 'height'],
 )
-
-
-frame = SimpleFrameControl()
-frame_window = Window(content=frame)
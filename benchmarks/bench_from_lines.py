@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import time
+
+import numpy as np
+
+from framework.core.graphics import Canvas, StyledText, Styles
+from framework.core.graphics.style_ids import STYLE_DTYPE, style_table
+
+SEGMENT = 'log entry #'
+
+
+def _lines(count: int, segments: int = 8) -> list[list[StyledText]]:
+    styles = [Styles.EMPTY, Styles.BOLD, Styles.Foreground.Console.GREEN]
+    return [
+        [StyledText(f'{SEGMENT}{i % 97:02} ', styles[(i + j) % len(styles)]) for j in range(segments)]
+        for i in range(count)
+    ]
+
+
+def _from_lines_concatenate(lines: list[list[StyledText]]) -> Canvas:
+    # The previous implementation: arrays grow segment by segment.
+    canvas_lines = []
+    canvas_styles = []
+    for line in lines:
+        canvas_line = np.array([], dtype='U1')
+        canvas_style = np.array([], dtype=STYLE_DTYPE)
+        for segment in line:
+            canvas_line = np.concatenate((canvas_line, np.array(list(segment), dtype='U1')))
+            style_id = style_table.intern(segment.style)
+            canvas_style = np.concatenate((canvas_style, np.full(len(segment), style_id, dtype=STYLE_DTYPE)))
+        canvas_lines.append(canvas_line)
+        canvas_styles.append(canvas_style)
+    return Canvas(np.vstack(canvas_lines), np.vstack(canvas_styles))
+
+
+def _measure(builder, lines: list[list[StyledText]], repeat: int = 5) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        builder(lines)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _report(label: str, cases: list[tuple[int, int]]):
+    print(f'{label:>9} {"from_lines, ms":>15} {"ns/cell":>8} {"concatenate, ms":>16} {"ns/cell":>8}')
+    for count, segments in cases:
+        lines = _lines(count, segments)
+        cells = sum(len(segment) for line in lines for segment in line)
+        current = _measure(Canvas.from_lines, lines)
+        previous = _measure(_from_lines_concatenate, lines, repeat=1)
+        size = count if label == 'lines' else segments
+        print(
+            f'{size:>9} {current * 1e3:>15.2f} {current / cells * 1e9:>8.1f}'
+            f' {previous * 1e3:>16.2f} {previous / cells * 1e9:>8.1f}'
+        )
+
+
+def main():
+    _report('lines', [(count, 8) for count in (500, 1000, 2000, 5000)])
+    print()
+    _report('segments', [(200, segments) for segments in (8, 32, 128, 512)])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,263 @@
+"""Headless render benchmarks for the graphics and widget pipeline.
+
+Every scenario renders frames at several terminal sizes into an in-memory sink and reports frames/sec,
+p50/p99 frame latency, bytes emitted per frame and peak allocations per frame (tracemalloc).
+
+    python -m benchmarks.bench_render --json current.json
+    python -m benchmarks.bench_render --compare baseline.json
+"""
+
+import argparse
+import io
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Callable, TextIO
+
+import numpy as np
+
+from app.core.widgets import DataBox, Layers, Padding, RootWidget
+from app.ui.frame import make_frame
+from framework.core.graphics import Canvas, Screen, StyledText, Styles
+
+SIZES = [(80, 24), (160, 48), (250, 80)]
+PADDING_DEPTH = 8
+
+Step = Callable[[int], int]
+
+
+class _Sink(io.TextIOBase):
+    """Terminal stand-in that only counts the UTF-8 bytes written to it."""
+
+    def __init__(self):
+        self.bytes = 0
+
+    def write(self, text: str) -> int:
+        self.bytes += len(text.encode())
+        return len(text)
+
+
+def _emitting(draw: Callable[[Screen, int], object]) -> Step:
+    sink = _Sink()
+    screen = Screen(sink)
+
+    def step(frame: int) -> int:
+        before = sink.bytes
+        draw(screen, frame)
+        return sink.bytes - before
+
+    return step
+
+
+def _from_lines(width: int, height: int) -> Step:
+    """A full screen of styled lines rebuilt with Canvas.from_lines every frame; one column changes per frame."""
+    gutter = Styles.Foreground.ConsoleBright.BLACK
+    number = Styles.Foreground.Console.CYAN
+    filler = 'x' * (width - 12)
+
+    def draw(screen: Screen, frame: int) -> None:
+        lines = [
+            [
+                StyledText(f'{row:>5} ', gutter),
+                StyledText(f'{(row * 7 + frame) % 100_000:>6}', number if row % 2 else Styles.BOLD),
+                StyledText(filler),
+            ]
+            for row in range(height)
+        ]
+        screen.flush(Canvas.from_lines(lines))
+
+    return _emitting(draw)
+
+
+def _overlay(width: int, height: int) -> Step:
+    """A popup moving over a static screen: overlay onto the background plus the diff against the last frame."""
+    stripe = Styles.Background.RGB.from_rgb(40, 40, 40)
+    base = Canvas.from_lines(
+        [[StyledText(f'{row:>4} ' + '.' * (width - 5), stripe if row % 2 else Styles.EMPTY)] for row in range(height)]
+    )
+    popup_width, popup_height = min(40, width), min(10, height)
+    popup = Canvas.from_lines(
+        [[StyledText(line, Styles.INVERSE)] for line in make_frame(None, popup_width, popup_height)]
+    )
+
+    def draw(screen: Screen, frame: int) -> None:
+        x = frame % (width - popup_width + 1)
+        y = frame % (height - popup_height + 1)
+        screen.flush(base.overlay(popup, x, y))
+
+    return _emitting(draw)
+
+
+def _padding(width: int, height: int) -> Step:
+    """The app/ui/frame DataBox inside nested Padding; its caption changes every frame and is redrawn alone."""
+
+    def captioned_frame(box: DataBox, box_width: int, box_height: int) -> list[str]:
+        lines = make_frame(box, box_width, box_height)
+        caption = f' frame {box.variables["tick"]} '[: box_width - 4]
+        lines[0] = lines[0][:2] + caption + lines[0][2 + len(caption) :]
+        return lines
+
+    box = DataBox(renderer=captioned_frame, variables={'tick': 0})
+    child = box
+    for _ in range(PADDING_DEPTH):
+        child = Padding(top=1, right=1, bottom=1, left=1, child=child)
+    root = RootWidget(child=child, size=(width, height))
+
+    def draw(screen: Screen, frame: int) -> None:
+        box.variables['tick'] = frame
+        root.draw(screen)
+
+    return _emitting(draw)
+
+
+def _full_redraw(width: int, height: int) -> Step:
+    """The nested Padding tree repainted from scratch every frame, as after a resize or a terminal reset."""
+    box = DataBox(renderer=make_frame, variables={'tick': 0}, depends_on=['tick'])
+    child = box
+    for _ in range(PADDING_DEPTH):
+        child = Padding(top=1, right=1, bottom=1, left=1, child=child)
+    root = RootWidget(child=child, size=(width, height))
+
+    def draw(screen: Screen, frame: int) -> None:
+        box.variables['tick'] = frame
+        root.invalidate()
+        screen.invalidate()
+        root.draw(screen)
+
+    return _emitting(draw)
+
+
+def _popup(width: int, height: int) -> Step:
+    """A help popup opened and closed over a dashboard in Layers; the dashboard is not rendered again."""
+    dashboard = DataBox(renderer=lambda box, w, h: [f'{row:>4} ' + '#' * (w - 5) for row in range(h)])
+    popup_width, popup_height = min(40, width), min(10, height)
+    popup = DataBox(renderer=make_frame)
+    layers = Layers()
+    layers.add(dashboard)
+    root = RootWidget(child=layers, size=(width, height))
+    rect = ((width - popup_width) // 2, (height - popup_height) // 2, popup_width, popup_height)
+    opened = None
+
+    def draw(screen: Screen, frame: int) -> None:
+        nonlocal opened
+        if opened is None:
+            opened = layers.add(popup, rect=rect, z=1)
+        else:
+            layers.remove(opened)
+            opened = None
+        root.draw(screen)
+
+    return _emitting(draw)
+
+
+SCENARIOS: dict[str, Callable[[int, int], Step]] = {
+    'from_lines': _from_lines,
+    'overlay': _overlay,
+    'padding': _padding,
+    'full_redraw': _full_redraw,
+    'popup': _popup,
+}
+
+
+def _run(step: Step, frames: int, warmup: int) -> dict[str, float]:
+    for frame in range(warmup):
+        step(frame)
+
+    latencies = np.empty(frames)
+    emitted = 0
+    started = time.perf_counter()
+    for i in range(frames):
+        frame_started = time.perf_counter()
+        emitted += step(warmup + i)
+        latencies[i] = time.perf_counter() - frame_started
+    elapsed = time.perf_counter() - started
+
+    # Allocation tracking slows frames down considerably, so it gets its own pass.
+    tracemalloc.start()
+    peaks = []
+    for i in range(min(frames, 20)):
+        before = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        step(warmup + frames + i)
+        peaks.append(tracemalloc.get_traced_memory()[1] - before)
+    tracemalloc.stop()
+
+    return {
+        'fps': frames / elapsed,
+        'p50_ms': float(np.percentile(latencies, 50)) * 1e3,
+        'p99_ms': float(np.percentile(latencies, 99)) * 1e3,
+        'bytes_per_frame': emitted / frames,
+        'alloc_peak_kib': max(peaks) / 1024,
+    }
+
+
+def _compare(results: list[dict], baseline_path: str, tolerance: float, out: TextIO) -> bool:
+    """Prints changes against a baseline report and returns False if latency or output size regressed."""
+    with open(baseline_path) as file:
+        baseline = {(r['scenario'], r['width'], r['height']): r for r in json.load(file)['results']}
+    ok = True
+    print(f'\n{"scenario":<12} {"size":>7} {"p50":>7} {"p99":>7} {"bytes":>7}', file=out)
+    for result in results:
+        previous = baseline.get((result['scenario'], result['width'], result['height']))
+        if previous is None:
+            continue
+        ratios = [result[metric] / max(previous[metric], 1e-9) for metric in ('p50_ms', 'p99_ms', 'bytes_per_frame')]
+        regressed = ratios[0] > 1 + tolerance or ratios[2] > 1 + tolerance
+        ok &= not regressed
+        size = f'{result["width"]}x{result["height"]}'
+        print(
+            f'{result["scenario"]:<12} {size:>7} {ratios[0]:>6.2f}x {ratios[1]:>6.2f}x {ratios[2]:>6.2f}x'
+            + ('  REGRESSION' if regressed else ''),
+            file=out,
+        )
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--frames', type=int, default=200, help='measured frames per scenario and size')
+    parser.add_argument('--warmup', type=int, default=20)
+    parser.add_argument('--scenario', action='append', choices=sorted(SCENARIOS), help='run only these scenarios')
+    parser.add_argument('--json', metavar='PATH', help="write the report as JSON ('-' for stdout)")
+    parser.add_argument('--compare', metavar='PATH', help='compare with a previous JSON report')
+    parser.add_argument('--tolerance', type=float, default=0.1, help='allowed p50/bytes growth for --compare')
+    args = parser.parse_args()
+
+    results = []
+    out = sys.stderr if args.json == '-' else sys.stdout
+    print(
+        f'{"scenario":<12} {"size":>7} {"fps":>8} {"p50, ms":>8} {"p99, ms":>8} {"B/frame":>9} {"peak, KiB":>10}',
+        file=out,
+    )
+    for name in args.scenario or SCENARIOS:
+        for width, height in SIZES:
+            result = {'scenario': name, 'width': width, 'height': height}
+            result.update(_run(SCENARIOS[name](width, height), args.frames, args.warmup))
+            results.append(result)
+            print(
+                f'{name:<12} {f"{width}x{height}":>7} {result["fps"]:>8.0f} {result["p50_ms"]:>8.3f}'
+                f' {result["p99_ms"]:>8.3f} {result["bytes_per_frame"]:>9.0f} {result["alloc_peak_kib"]:>10.1f}',
+                file=out,
+            )
+
+    if args.json:
+        report = {
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'frames': args.frames,
+            'results': results,
+        }
+        if args.json == '-':
+            json.dump(report, sys.stdout, indent=2)
+            sys.stdout.write('\n')
+        else:
+            with open(args.json, 'w') as file:
+                json.dump(report, file, indent=2)
+    if args.compare and not _compare(results, args.compare, args.tolerance, out):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import io
+
+import numpy as np
+
+from framework.core.graphics import Canvas, Screen, Style, StyledText, Styles, style_table
+from framework.core.graphics.control import Control
+
+WIDTH = 250
+HEIGHT = 80
+
+
+def _table() -> Canvas:
+    """A colored table: bold header, zebra-striped rows, one color per column, red negative numbers."""
+    column_styles = [
+        Styles.Foreground.Console.CYAN,
+        Styles.Foreground.Console.WHITE,
+        Styles.Foreground.RGB.from_rgb(255, 170, 0),
+        Styles.Foreground.ConsoleBright.GREEN,
+    ]
+    stripe = Styles.Background.RGB.from_rgb(40, 40, 40)
+    lines = [[StyledText(f'{"column " + str(c):<24}|', Style.mix(Styles.BOLD, Styles.UNDERLINE)) for c in range(10)]]
+    for row in range(1, HEIGHT):
+        line = []
+        for column in range(10):
+            value = (row * 37 + column * 11) % 200 - 100
+            style = Styles.Foreground.Console.RED if value < 0 else column_styles[column % len(column_styles)]
+            if row % 2:
+                style = Style.mix(style, stripe)
+            line.append(StyledText(f'{value:>24}', style))
+            line.append(StyledText('|', stripe if row % 2 else Styles.EMPTY))
+        lines.append(line)
+    return Canvas.from_lines(lines)
+
+
+def _syntax() -> Canvas:
+    """Source code listing: short colored tokens separated by plain text."""
+    keyword = Styles.Foreground.Console.MAGENTA
+    name = Styles.Foreground.Console.BLUE
+    string = Styles.Foreground.Console.GREEN
+    lines = []
+    for row in range(HEIGHT):
+        lines.append(
+            [
+                StyledText(f'{row + 1:>4} ', Styles.Foreground.ConsoleBright.BLACK),
+                StyledText('def', keyword),
+                StyledText(' '),
+                StyledText(f'handler_{row}', name),
+                StyledText('(event): return '),
+                StyledText(f"'{row:x}'", string),
+                StyledText(' ' * (WIDTH - 40)),
+            ]
+        )
+    return Canvas.from_lines(lines)
+
+
+def _naive(canvas: Canvas) -> str:
+    """Full repaint wrapping every style run in its own begin/end sequences."""
+    parts = [Control.erase_data(2)]
+    for row in range(canvas.height):
+        parts.append(Control.cursor_position(row + 1, 1))
+        styles = canvas.style[row]
+        bounds = [0, *(np.flatnonzero(styles[1:] != styles[:-1]) + 1).tolist(), canvas.width]
+        for start, end in zip(bounds, bounds[1:]):
+            style = style_table[int(styles[start])]
+            parts.append(style.begin + ''.join(canvas.text[row, start:end].tolist()) + style.end)
+    return ''.join(parts)
+
+
+def main():
+    print(
+        f'{"screen":<8} {"cells":>6} {"naive, B":>9} {"escapes":>8}'
+        f' {"compressed, B":>14} {"escapes":>8} {"size ratio":>11} {"escape ratio":>13}'
+    )
+    for name, canvas in (('table', _table()), ('syntax', _syntax())):
+        cells = canvas.width * canvas.height
+        naive = len(_naive(canvas))
+        compressed = Screen(io.StringIO()).flush(canvas)
+        print(
+            f'{name:<8} {cells:>6} {naive:>9} {naive - cells:>8} {compressed:>14} {compressed - cells:>8}'
+            f' {compressed / naive:>11.2f} {(compressed - cells) / (naive - cells):>13.2f}'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+import timeit
+
+from framework.core.concepts import SizeBox
+from framework.core.graphics import Style, StyledText, Styles
+
+NUMBER = 100_000
+
+
+def _pydantic_builders():
+    """The pydantic-based definitions the value types replaced, or None when pydantic is not installed."""
+    try:
+        from pydantic import BaseModel, Field
+        from pydantic.dataclasses import dataclass
+    except ImportError:
+        return None
+
+    @dataclass(frozen=True, slots=True)
+    class PydanticStyle:
+        begin: str
+        end: str
+
+    empty = PydanticStyle('', '')
+
+    @dataclass
+    class PydanticStyledText:
+        text: str
+        style: PydanticStyle = empty
+
+    class PydanticSizeBox(BaseModel):
+        width: int = Field(gt=0)
+        height: int = Field(gt=0)
+
+    def from_rgb(r: int, g: int, b: int) -> PydanticStyle:
+        return PydanticStyle(f'\033[38;2;{r};{g};{b}m', '\033[39m')
+
+    def mix(*styles: PydanticStyle) -> PydanticStyle:
+        return PydanticStyle(''.join(s.begin for s in styles), ''.join(s.end for s in styles))
+
+    bold = PydanticStyle('\033[1m', '\033[22m')
+    stripe = PydanticStyle('\033[48;2;40;40;40m', '\033[49m')
+    return {
+        'StyledText': lambda: PydanticStyledText('cell', bold),
+        'SizeBox': lambda: PydanticSizeBox(width=80, height=25),
+        'from_rgb': lambda: from_rgb(255, 170, 0),
+        'mix': lambda: mix(bold, from_rgb(255, 170, 0), stripe),
+    }
+
+
+def _measure(builder) -> float:
+    return min(timeit.repeat(builder, number=NUMBER, repeat=5)) / NUMBER
+
+
+def main():
+    stripe = Styles.Background.RGB.from_rgb(40, 40, 40)
+    current = {
+        'StyledText': lambda: StyledText('cell', Styles.BOLD),
+        'SizeBox': lambda: SizeBox(80, 25),
+        'from_rgb': lambda: Styles.Foreground.RGB.from_rgb(255, 170, 0),
+        'mix': lambda: Style.mix(Styles.BOLD, Styles.Foreground.RGB.from_rgb(255, 170, 0), stripe),
+    }
+    previous = _pydantic_builders()
+    print(f'{"type":<12} {"slotted, ns":>12} {"pydantic, ns":>13} {"speedup":>8}')
+    for name, builder in current.items():
+        after = _measure(builder)
+        if previous is None:
+            print(f'{name:<12} {after * 1e9:>12.0f} {"-":>13} {"-":>8}')
+            continue
+        before = _measure(previous[name])
+        print(f'{name:<12} {after * 1e9:>12.0f} {before * 1e9:>13.0f} {before / after:>7.1f}x')
+
+
+if __name__ == '__main__':
+    main()
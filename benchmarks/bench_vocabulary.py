@@ -0,0 +1,61 @@
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from app.db.vocabulary import VocabularyStore
+
+ENTRIES = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+
+
+def _timed(action):
+    start = time.perf_counter()
+    result = action()
+    return result, (time.perf_counter() - start) * 1e3
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        json_path = Path(directory) / 'db.json'
+        data = {f'word{i:07d}': {'translation': f'слово {i}', 'rate': (i * 7919 % 1000) / 100} for i in range(ENTRIES)}
+        with open(json_path, 'w', encoding='utf-8') as file:
+            json.dump(data, file, ensure_ascii=False)
+        del data
+
+        def load_json():
+            with open(json_path, encoding='utf-8') as file:
+                return json.load(file)
+
+        data, json_load = _timed(load_json)
+        data['word0000042']['rate'] = 0.5
+
+        def rewrite_json():
+            with open(json_path, 'w', encoding='utf-8') as file:
+                json.dump(data, file, ensure_ascii=False)
+
+        _, json_rewrite = _timed(rewrite_json)
+
+        with VocabularyStore(Path(directory) / 'db.sqlite3') as store:
+            _, migrate = _timed(lambda: store.import_json(json_path))
+
+        store, open_store = _timed(lambda: VocabularyStore(Path(directory) / 'db.sqlite3'))
+        with store:
+            _, lookup = _timed(lambda: store.get('word0000042'))
+            _, prefix = _timed(lambda: store.search('WORD00001', limit=20))
+            _, lowest = _timed(lambda: store.by_rate(20))
+            _, update = _timed(lambda: store.set_rate('word0000042', 0.5))
+
+    print(f'{ENTRIES} entries')
+    print(f'{"json.load":<28} {json_load:>10.1f} ms')
+    print(f'{"json rewrite after 1 update":<28} {json_rewrite:>10.1f} ms')
+    print(f'{"one-time migration":<28} {migrate:>10.1f} ms')
+    print(f'{"open store":<28} {open_store:>10.3f} ms')
+    print(f'{"get":<28} {lookup:>10.3f} ms')
+    print(f'{"prefix search, 20 rows":<28} {prefix:>10.3f} ms')
+    print(f'{"lowest rate, 20 rows":<28} {lowest:>10.3f} ms')
+    print(f'{"set_rate":<28} {update:>10.3f} ms')
+
+
+if __name__ == '__main__':
+    main()
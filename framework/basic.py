@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from framework.core.concepts import Constraints, Position, SizeBox
+from framework.core.render_object import RenderObject
+from framework.core.widget import RenderObjectWidget, Widget
+
+
+class SizedBox(RenderObjectWidget):
+    """Виджет фиксированного размера. Ребёнок получает жёсткие ограничения и становится границей релэйаута."""
+
+    def __init__(self, *, width: int, height: int, child: Widget | None = None, key: str | None = None) -> None:
+        super().__init__(key)
+        self.width = width
+        self.height = height
+        self.children = (child,) if child is not None else ()
+
+    def create_render_object(self) -> RenderObject:
+        return RenderSizedBox(self.width, self.height)
+
+
+class RenderSizedBox(RenderObject):
+    def __init__(self, width: int, height: int):
+        super().__init__()
+        self.width = width
+        self.height = height
+
+    def update(self, new_widget: Widget):
+        assert isinstance(new_widget, SizedBox)
+        if (new_widget.width, new_widget.height) != (self.width, self.height):
+            self.width, self.height = new_widget.width, new_widget.height
+            self.mark_needs_layout()
+
+    def perform_layout(self, constraints: Constraints) -> SizeBox:
+        size = constraints.constrain(self.width, self.height)
+        for child in self.children:
+            child.position = Position(x=0, y=0)
+            child.layout(Constraints.tight(size))
+        return size
@@ -1,9 +1,38 @@
-from .element import Element
-from .render_object import RenderObject
-from .widget import Widget
+from typing import TYPE_CHECKING
+
+from framework.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .concepts import Constraints, Position, SizeBox
+    from .element import Element, RenderObjectElement
+    from .pipeline import PipelineOwner
+    from .render_object import RenderObject
+    from .widget import RenderObjectWidget, Widget
+
+# Exported names are imported from their modules on first access.
+_exports = {
+    'Constraints': '.concepts',
+    'Element': '.element',
+    'PipelineOwner': '.pipeline',
+    'Position': '.concepts',
+    'RenderObject': '.render_object',
+    'RenderObjectElement': '.element',
+    'RenderObjectWidget': '.widget',
+    'SizeBox': '.concepts',
+    'Widget': '.widget',
+}
 
 __all__ = [
+    'Constraints',
     'Element',
+    'PipelineOwner',
+    'Position',
     'RenderObject',
+    'RenderObjectElement',
+    'RenderObjectWidget',
+    'SizeBox',
     'Widget',
 ]
+
+
+__getattr__, __dir__ = lazy_exports(globals(), _exports)
@@ -1,11 +1,77 @@
-from pydantic import BaseModel, Field
+from __future__ import annotations
 
+from framework.core import values
+from framework.core.values import Value, _set
 
-class SizeBox(BaseModel):
-    width: int = Field(gt=0)
-    height: int = Field(gt=0)
 
+class SizeBox(Value):
+    __slots__ = ('width', 'height')
 
-class Position(BaseModel):
-    x: int = Field(ge=0)
-    y: int = Field(ge=0)
+    width: int
+    height: int
+
+    def __init__(self, width: int, height: int):
+        _set(self, 'width', width)
+        _set(self, 'height', height)
+        if values.DEBUG:
+            self._validate()
+
+    def _validate(self) -> None:
+        if self.width < 0 or self.height < 0:
+            raise ValueError(f'{self!r}: sizes must be non-negative')
+
+
+class Position(Value):
+    __slots__ = ('x', 'y')
+
+    x: int
+    y: int
+
+    def __init__(self, x: int, y: int):
+        _set(self, 'x', x)
+        _set(self, 'y', y)
+        if values.DEBUG:
+            self._validate()
+
+    def _validate(self) -> None:
+        if self.x < 0 or self.y < 0:
+            raise ValueError(f'{self!r}: coordinates must be non-negative')
+
+
+class Constraints(Value):
+    __slots__ = ('min_width', 'max_width', 'min_height', 'max_height')
+
+    min_width: int
+    max_width: int
+    min_height: int
+    max_height: int
+
+    def __init__(self, min_width: int, max_width: int, min_height: int, max_height: int):
+        _set(self, 'min_width', min_width)
+        _set(self, 'max_width', max_width)
+        _set(self, 'min_height', min_height)
+        _set(self, 'max_height', max_height)
+        if values.DEBUG:
+            self._validate()
+
+    def _validate(self) -> None:
+        if not (0 <= self.min_width <= self.max_width and 0 <= self.min_height <= self.max_height):
+            raise ValueError(f'{self!r}: expected 0 <= min <= max on both axes')
+
+    @staticmethod
+    def tight(size: SizeBox) -> Constraints:
+        return Constraints(size.width, size.width, size.height, size.height)
+
+    @staticmethod
+    def loose(size: SizeBox) -> Constraints:
+        return Constraints(0, size.width, 0, size.height)
+
+    @property
+    def is_tight(self) -> bool:
+        return self.min_width == self.max_width and self.min_height == self.max_height
+
+    def constrain(self, width: int, height: int) -> SizeBox:
+        return SizeBox(
+            min(max(width, self.min_width), self.max_width),
+            min(max(height, self.min_height), self.max_height),
+        )
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 from abc import abstractmethod
-from typing import TYPE_CHECKING, List, Optional
+from collections import deque
+from typing import TYPE_CHECKING, Deque, Dict, List, Optional, Sequence, Set
 
 if TYPE_CHECKING:
     from framework.core import RenderObject, Widget
@@ -11,36 +12,156 @@ class Element:
     def __init__(self, widget: Widget):
         self.widget = widget
         self._children: List[Element] = []
+        self._keyed: Dict[str, Element] = {}
+        self._slot = 0
         self.parent: Optional[Element] = None
         self._render_object: Optional[RenderObject] = None
 
-    def mount(self, parent: Optional['Element']):
-        self.parent = parent
+    @property
+    def children(self) -> Sequence[Element]:
+        return self._children
+
+    def child_by_key(self, key: str) -> Optional[Element]:
+        return self._keyed.get(key)
+
+    def mount(self, parent: Optional['Element'], slot: Optional[int] = None):
+        self._activate(parent)
         if parent is not None:
-            parent._children.append(self)
-        self._render_object = self.create_render_object()
-        self._render_object.element = self
+            parent._insert_child(self, len(parent._children) if slot is None else slot)
+            parent._sync_render_children()
 
     def unmount(self):
-        if self.parent is not None and self in self.parent._children:
-            self.parent._children.remove(self)
-        self.parent = None
-        if self._render_object is not None:
-            self._render_object.element = None
-            self._render_object = None
+        parent = self.parent
+        if parent is not None:
+            parent._remove_child(self)
+        self._deactivate()
+        if parent is not None:
+            parent._sync_render_children()
 
     def update(self, new_widget: Widget):
         if not self.widget.can_update(new_widget):
+            parent, slot = self.parent, self._slot
             self.unmount()
             new_element = new_widget.create_element()
-            new_element.mount(self.parent)
+            new_element.mount(parent, slot)
             return new_element
 
-        self.widget = new_widget
-        if self._render_object is not None:
-            self._render_object.update(new_widget)
+        self._update_widget(new_widget)
         return self
 
+    def update_children(self, new_widgets: Sequence[Widget]):
+        """Сверяет дочерние элементы с новым списком виджетов.
+
+        Дети с ключом сопоставляются по Widget.key, без ключа — по типу в порядке следования.
+        Подходящие элементы (и их рендер-объекты) переиспользуются, остальные создаются и удаляются.
+        Работает за линейное время от числа детей.
+        """
+        # Validated up front: failing halfway would leave children activated, reparented or dropped from _keyed.
+        seen: Set[str] = set()
+        for widget in new_widgets:
+            if widget.key is not None:
+                if widget.key in seen:
+                    raise ValueError(f'Duplicate key {widget.key!r} among children')
+                seen.add(widget.key)
+
+        old_keyed = self._keyed
+        unkeyed: Dict[type, Deque[Element]] = {}
+        for child in self._children:
+            if child.widget.key is None:
+                unkeyed.setdefault(type(child.widget), deque()).append(child)
+
+        children: List[Element] = []
+        keyed: Dict[str, Element] = {}
+        for widget in new_widgets:
+            if widget.key is not None:
+                old = old_keyed.pop(widget.key, None)
+            else:
+                candidates = unkeyed.get(type(widget))
+                old = candidates.popleft() if candidates else None
+
+            if old is not None and old.widget.can_update(widget):
+                old._update_widget(widget)
+                element = old
+            else:
+                if old is not None:
+                    old._deactivate()
+                element = widget.create_element()
+                element._activate(self)
+
+            element._slot = len(children)
+            children.append(element)
+            if widget.key is not None:
+                keyed[widget.key] = element
+
+        for element in old_keyed.values():
+            element._deactivate()
+        for candidates in unkeyed.values():
+            for element in candidates:
+                element._deactivate()
+        self._children = children
+        self._keyed = keyed
+        self._sync_render_children()
+
     @abstractmethod
     def create_render_object(self) -> RenderObject:
         pass
+
+    def _update_widget(self, new_widget: Widget):
+        self.widget = new_widget
+        if self._render_object is not None:
+            self._render_object.update(new_widget)
+
+    def _activate(self, parent: Optional[Element]):
+        self.parent = parent
+        self._render_object = self.create_render_object()
+        self._render_object.element = self
+
+    def _deactivate(self):
+        for child in self._children:
+            child._deactivate()
+        self._children = []
+        self._keyed = {}
+        self.parent = None
+        if self._render_object is not None:
+            self._render_object.element = None
+            self._render_object = None
+
+    def _insert_child(self, child: Element, slot: int):
+        self._children.insert(slot, child)
+        self._reslot(slot)
+        if child.widget.key is not None:
+            self._keyed[child.widget.key] = child
+
+    def _remove_child(self, child: Element):
+        slot = child._slot
+        if slot >= len(self._children) or self._children[slot] is not child:
+            return
+        del self._children[slot]
+        self._reslot(slot)
+        if child.widget.key is not None and self._keyed.get(child.widget.key) is child:
+            del self._keyed[child.widget.key]
+
+    def _sync_render_children(self):
+        if self._render_object is not None:
+            self._render_object.set_children(
+                [child._render_object for child in self._children if child._render_object is not None]
+            )
+
+    def _reslot(self, start: int):
+        for slot in range(start, len(self._children)):
+            self._children[slot]._slot = slot
+
+
+class RenderObjectElement(Element):
+    """Элемент виджета, который сам создаёт рендер-объект и описывает детей списком виджетов."""
+
+    def create_render_object(self) -> RenderObject:
+        return self.widget.create_render_object()
+
+    def _activate(self, parent: Optional[Element]):
+        super()._activate(parent)
+        self.update_children(self.widget.children)
+
+    def _update_widget(self, new_widget: Widget):
+        super()._update_widget(new_widget)
+        self.update_children(new_widget.children)
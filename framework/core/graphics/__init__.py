@@ -1,12 +1,41 @@
-from .canvas import Canvas
-from .canvas_line import CanvasLine
-from .styled_line import StyledText
-from .styles import Style, Styles
+from typing import TYPE_CHECKING
+
+from framework.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .canvas import Canvas
+    from .cells import GraphemeTable, display_width, grapheme_table
+    from .screen import Screen
+    from .style_ids import StyleTable, style_table
+    from .styled_line import StyledText
+    from .styles import Style, Styles
+
+# Exported names are imported from their modules on first access.
+_exports = {
+    'Canvas': '.canvas',
+    'GraphemeTable': '.cells',
+    'Screen': '.screen',
+    'StyledText': '.styled_line',
+    'Style': '.styles',
+    'StyleTable': '.style_ids',
+    'Styles': '.styles',
+    'display_width': '.cells',
+    'grapheme_table': '.cells',
+    'style_table': '.style_ids',
+}
 
 __all__ = [
     'Canvas',
-    'CanvasLine',
-    'StyledText',
+    'GraphemeTable',
+    'Screen',
     'Style',
+    'StyleTable',
+    'StyledText',
     'Styles',
+    'display_width',
+    'grapheme_table',
+    'style_table',
 ]
+
+
+__getattr__, __dir__ = lazy_exports(globals(), _exports)
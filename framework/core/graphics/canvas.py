@@ -4,38 +4,59 @@ from typing import TYPE_CHECKING, List
 
 import numpy as np
 
+from .cells import CONTINUATION, cell_widths, single_width, text_cells
+from .style_ids import STYLE_DTYPE, style_table
+
 if TYPE_CHECKING:
     from numpy.typing import NDArray
 
     from framework.core.graphics import StyledText
+    from framework.core.graphics.screen import Screen
 
 
 class Canvas:
     text: np.ndarray
     style: np.ndarray
 
-    def __init__(self, text: NDArray[np.str_], style: NDArray[np.object_]):
+    def __init__(self, text: NDArray[np.str_], style: NDArray[np.uint16]):
         assert text.shape == style.shape
         self.text = text
         self.style = style
 
     @staticmethod
-    def from_lines(lines: List[List[StyledText]]):
-        canvas_lines = []
-        canvas_styles = []
-        for line in lines:
-            canvas_line = np.array([])
-            canvas_style = np.array([])
+    def from_lines(lines: List[List[StyledText]]) -> Canvas:
+        line_texts = [''.join(segment.text for segment in line) for line in lines]
+        width = max(map(len, line_texts), default=0)
+        if not width:
+            return Canvas.empty(width, len(lines))
+        text = np.array([''.join(line_text.ljust(width) for line_text in line_texts)]).view('U1')
+        text = text.reshape(len(lines), width)
+        if not single_width(text):
+            return Canvas._from_wide_lines(lines)
+        canvas = Canvas(text, np.zeros(text.shape, dtype=STYLE_DTYPE))
+        for row, line in enumerate(lines):
+            column = 0
             for segment in line:
-                canvas_line = np.concatenate((canvas_line, np.array(list(segment))))
-                canvas_style = np.concatenate((canvas_style, np.full(len(segment), segment.style)))
-            canvas_lines.append(canvas_line)
-            canvas_styles.append(canvas_style)
-
-        text = np.vstack(canvas_lines)
-        styles = np.vstack(canvas_styles)
+                end = column + len(segment)
+                style_id = style_table.intern(segment.style)
+                if style_id:
+                    canvas.style[row, column:end] = style_id
+                column = end
+        return canvas
 
-        return Canvas(text, styles)
+    @staticmethod
+    def _from_wide_lines(lines: List[List[StyledText]]) -> Canvas:
+        """from_lines для текста с двойными символами или кластерами: ячейки раскладываются по сегментам."""
+        cells = [[text_cells(segment.text) for segment in line] for line in lines]
+        canvas = Canvas.empty(max(sum(map(len, row)) for row in cells), len(lines))
+        for row, (line, row_cells) in enumerate(zip(lines, cells)):
+            column = 0
+            for segment, segment_cells in zip(line, row_cells):
+                end = column + len(segment_cells)
+                canvas.text[row, column:end] = segment_cells
+                canvas.style[row, column:end] = style_table.intern(segment.style)
+                column = end
+        return canvas
 
     @property
     def height(self) -> int:
@@ -48,7 +69,7 @@ class Canvas:
     @staticmethod
     def empty(width: int, height: int) -> Canvas:
         text = np.full((height, width), ' ', dtype='U1')
-        styles = np.full((height, width), None, dtype=object)
+        styles = np.zeros((height, width), dtype=STYLE_DTYPE)
         return Canvas(text, styles)
 
     def overlay(self, other: Canvas, x: int = 0, y: int = 0) -> Canvas:
@@ -58,11 +79,83 @@ class Canvas:
             y = self.height - other.height + y + 1
         assert x + other.width <= self.width and y + other.height <= self.height, 'Overlay dimensions are out of bounds'
 
-        new_text = np.copy(self.text)
-        new_styles = np.copy(self.style)
-        new_text[y : y + other.height, x : x + other.width] = other.text
-        new_styles[y : y + other.height, x : x + other.width] = other.style
-        return Canvas(new_text, new_styles)
-
-    def draw(self):
-        pass
+        return other.blit_into(Canvas(np.copy(self.text), np.copy(self.style)), x, y, clip=False)
+
+    def blit_into(self, target: Canvas, x: int = 0, y: int = 0, clip: bool = True) -> Canvas:
+        blit_planes(self.text, self.style, target.text, target.style, x, y, clip)
+        return target
+
+    def clear(self, x: int = 0, y: int = 0, width: int | None = None, height: int | None = None) -> None:
+        clear_planes(self.text, self.style, x, y, width, height)
+
+    def cell_widths(self) -> NDArray[np.uint8]:
+        """Экранные ширины всех ячеек одной операцией."""
+        return cell_widths(self.text)
+
+    def draw(self, screen: Screen | None = None) -> int:
+        if screen is None:
+            global _default_screen
+            if _default_screen is None:
+                from framework.core.graphics.screen import Screen
+
+                _default_screen = Screen()
+            screen = _default_screen
+        return screen.flush(self)
+
+
+def blit_planes(
+    text: NDArray[np.str_],
+    style: NDArray[np.uint16],
+    target_text: NDArray[np.str_],
+    target_style: NDArray[np.uint16],
+    x: int,
+    y: int,
+    clip: bool = True,
+) -> None:
+    """Копирует плоскости text/style в target по смещению (x, y) без промежуточных копий."""
+    height, width = text.shape
+    target_height, target_width = target_text.shape
+    left, top = max(x, 0), max(y, 0)
+    right, bottom = min(x + width, target_width), min(y + height, target_height)
+    if not clip and (left, top, right, bottom) != (x, y, x + width, y + height):
+        raise ValueError('Blit dimensions are out of bounds')
+    if left >= right or top >= bottom:
+        return
+    target_text[top:bottom, left:right] = text[top - y : bottom - y, left - x : right - x]
+    target_style[top:bottom, left:right] = style[top - y : bottom - y, left - x : right - x]
+    _repair_wide_edges(target_text, left, top, right, bottom)
+
+
+def clear_planes(
+    text: NDArray[np.str_],
+    style: NDArray[np.uint16],
+    x: int = 0,
+    y: int = 0,
+    width: int | None = None,
+    height: int | None = None,
+) -> None:
+    """Заполняет прямоугольник пробелами стиля по умолчанию."""
+    right = text.shape[1] if width is None else min(x + width, text.shape[1])
+    bottom = text.shape[0] if height is None else min(y + height, text.shape[0])
+    if x >= right or y >= bottom:
+        return
+    text[y:bottom, x:right] = ' '
+    style[y:bottom, x:right] = 0
+    _repair_wide_edges(text, x, y, right, bottom)
+
+
+def _repair_wide_edges(text: NDArray[np.str_], left: int, top: int, right: int, bottom: int) -> None:
+    """Заменяет пробелами половины двойных символов, разрезанных границами перезаписанного прямоугольника."""
+    rows = text[top:bottom]
+    rows[rows[:, left] == CONTINUATION, left] = ' '
+    if left > 0:
+        rows[cell_widths(rows[:, left - 1]) == 2, left - 1] = ' '
+    inner = cell_widths(rows[:, right - 1]) == 2
+    if right < text.shape[1]:
+        orphan = rows[:, right] == CONTINUATION
+        rows[orphan & ~inner, right] = ' '
+        inner &= ~orphan
+    rows[inner, right - 1] = ' '
+
+
+_default_screen: Screen | None = None
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Iterator
+
+import numpy as np
+
+from ._width_ranges import WIDE, ZERO
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+# Right half of a double-width character: the cell is occupied by the character to its left.
+CONTINUATION = '\0'
+
+_ZWJ = '\u200d'
+_EMOJI_PRESENTATION = '\ufe0f'
+_REGIONAL_INDICATORS = range(0x1F1E6, 0x1F200)
+_EMOJI_MODIFIERS = range(0x1F3FB, 0x1F400)
+# Grapheme clusters are stored in the plane 15-16 private use areas, one code point per interned cluster.
+_CLUSTER_FIRST = 0xF0000
+_CLUSTER_LAST = 0x10FFFD
+
+_widths: NDArray[np.uint8] | None = None
+_widths_lock = threading.Lock()
+
+
+def _width_table() -> NDArray[np.uint8]:
+    """Таблица ширины в ячейках для всех кодовых точек, строится один раз при первом обращении."""
+    global _widths
+    if _widths is not None:
+        return _widths
+    with _widths_lock:
+        if _widths is not None:
+            return _widths
+        widths = np.ones(0x110000, dtype=np.uint8)
+        # Planes 0-1 hold nearly every assigned character; their widths come from ranges of the Unicode database.
+        for start, end in WIDE:
+            widths[start:end] = 2
+        for start, end in ZERO:
+            widths[start:end] = 0
+        widths[0x1160:0x1200] = 0  # Hangul medial vowels and final consonants join the preceding syllable.
+        widths[0x20000:0x3FFFE] = 2  # CJK ideograph extensions.
+        widths[0xE0000:0xE1000] = 0  # Tags and variation selectors supplement.
+        widths[ord(CONTINUATION)] = 0
+        _widths = widths
+    return _widths
+
+
+def char_widths(codes: NDArray[np.uint32]) -> NDArray[np.uint8]:
+    """Ширины кодовых точек (или ячеек плоскости текста, через view(np.uint32)) одной операцией."""
+    return _width_table()[codes]
+
+
+def cell_widths(text: NDArray[np.str_]) -> NDArray[np.uint8]:
+    """Экранные ширины ячеек плоскости текста: 2 у двойных символов, 0 у их продолжений."""
+    return char_widths(text.view(np.uint32))
+
+
+def single_width(cells: NDArray[np.str_]) -> bool:
+    """Все ли ячейки — символы одинарной ширины, то есть строка раскладывается по одной кодовой точке на ячейку."""
+    widths = cell_widths(cells)
+    return widths.size == 0 or (widths.min() == 1 and widths.max() == 1)
+
+
+def display_width(text: str) -> int:
+    """Число ячеек, которое займёт строка."""
+    return len(text_cells(text))
+
+
+class GraphemeTable:
+    """Интернирует графемные кластеры из нескольких кодовых точек.
+
+    Каждому кластеру выделяется кодовая точка из области частного использования, которая и хранится в ячейке.
+    При выводе она заменяется обратно на кластер через translation. Интернировать можно из любого потока.
+    """
+
+    def __init__(self):
+        self._codes: dict[str, str] = {}
+        self.translation: dict[int, str | None] = {ord(CONTINUATION): None}
+        self._lock = threading.Lock()
+
+    def intern(self, cluster: str) -> str:
+        char = self._codes.get(cluster)
+        if char is not None:
+            return char
+        with self._lock:
+            char = self._codes.get(cluster)
+            if char is None:
+                code = _CLUSTER_FIRST + len(self._codes)
+                if code > _CLUSTER_LAST:
+                    raise OverflowError('Too many distinct grapheme clusters')
+                width = 2 if _EMOJI_PRESENTATION in cluster else max(int(_width_table()[ord(cluster[0])]), 1)
+                # The width and translation go in before the code is published in _codes.
+                _width_table()[code] = width
+                self.translation[code] = cluster
+                char = self._codes[cluster] = chr(code)
+        return char
+
+    def __getitem__(self, char: str) -> str:
+        return self.translation.get(ord(char)) or char
+
+    def __len__(self) -> int:
+        return len(self._codes)
+
+
+grapheme_table = GraphemeTable()
+
+
+def _clusters(text: str, widths: NDArray[np.uint8]) -> Iterator[str]:
+    """Упрощённое разбиение на графемные кластеры: символ с последующими нулевой ширины, ZWJ-цепочки, флаги."""
+    length = len(text)
+    start = 0
+    while start < length:
+        end = start + 1
+        if ord(text[start]) in _REGIONAL_INDICATORS and end < length and ord(text[end]) in _REGIONAL_INDICATORS:
+            end += 1
+        while end < length:
+            if text[end] == _ZWJ:
+                end = min(end + 2, length)
+            elif widths[end] == 0 or ord(text[end]) in _EMOJI_MODIFIERS:
+                end += 1
+            else:
+                break
+        yield text[start:end]
+        start = end
+
+
+def text_cells(text: str) -> NDArray[np.str_]:
+    """Раскладывает строку в массив ячеек U1.
+
+    Строка из одних символов одинарной ширины раскладывается одной операцией. Иначе двойные символы
+    получают ячейку-продолжение, а кластеры из нескольких кодовых точек интернируются в grapheme_table.
+    """
+    if not text:
+        return np.empty(0, dtype='U1')
+    cells = np.array([text]).view('U1')
+    if single_width(cells):
+        return cells
+
+    table = _width_table()
+    result: list[str] = []
+    for cluster in _clusters(text, cell_widths(cells)):
+        if len(cluster) == 1 and table[ord(cluster)]:
+            char = cluster
+        else:
+            # A mark with nothing to combine with gets a space to sit on, like a dotted circle in fonts.
+            char = grapheme_table.intern(cluster if table[ord(cluster[0])] else ' ' + cluster)
+        result.append(char)
+        if table[ord(char)] == 2:
+            result.append(CONTINUATION)
+    return np.array(result, dtype='U1')
+
+
+def cells_text(cells: str) -> str:
+    """Текст для вывода в терминал из строки ячеек: без продолжений и с развёрнутыми кластерами."""
+    return cells if cells.isprintable() else cells.translate(grapheme_table.translation)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from app.core.tools import _csi
+from .styles import _csi
 
 
 class Control:
@@ -16,5 +16,10 @@ class Control:
     erase_line = staticmethod(lambda n=0: _csi('K', n))
     scroll_up = staticmethod(lambda n=1: _csi('S', n))
     scroll_down = staticmethod(lambda n=1: _csi('T', n))
+    set_scrolling_region = staticmethod(lambda top, bottom: _csi('r', top, bottom))
+    reset_scrolling_region = staticmethod(lambda: _csi('r'))
     save_cursor_position = staticmethod(lambda: _csi('s'))
     restore_cursor_position = staticmethod(lambda: _csi('u'))
+    # Synchronized output (mode 2026): the terminal holds back rendering until the end sequence.
+    begin_synchronized_update = staticmethod(lambda: '\033[?2026h')
+    end_synchronized_update = staticmethod(lambda: '\033[?2026l')
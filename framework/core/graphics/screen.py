@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import sys
+from typing import TYPE_CHECKING, Iterable, TextIO
+
+import numpy as np
+
+from framework.core.profiler import profiler
+
+from .canvas import Canvas
+from .cells import CONTINUATION, cells_text
+from .control import Control
+from .sgr import sgr_encoder
+from .styles import _sgr
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+Region = tuple[int, int, int, int]
+
+# Unchanged cells between two changed runs are rewritten instead of moving the cursor
+# when the gap is shorter than a cursor_position sequence.
+_MERGE_GAP = 4
+
+
+class Screen:
+    """Терминал, на который последовательно выводятся кадры (Canvas)."""
+
+    def __init__(self, stream: TextIO | None = None):
+        self._stream = stream if stream is not None else sys.stdout
+        self._previous: Canvas | None = None
+        self._pending: list[str] = []
+        # Style id whose attributes the terminal currently has active.
+        self._style_id = 0
+
+    def invalidate(self) -> None:
+        """Забывает выведенный кадр: следующий flush перерисует экран целиком."""
+        self._previous = None
+        self._pending.clear()
+
+    def scroll(self, top: int, bottom: int, delta: int) -> None:
+        """Сдвигает строки [top, bottom) терминала на delta вверх (delta < 0 — вниз) аппаратной прокруткой.
+
+        Запомненный кадр сдвигается так же, поэтому следующий flush дорисует только открывшиеся строки.
+        """
+        previous = self._previous
+        if previous is None or not delta or abs(delta) >= bottom - top or bottom > previous.height:
+            return
+        # Lines exposed by scrolling are filled with the current background, so return to the default first.
+        self._pending.append(sgr_encoder.transition(self._style_id, 0))
+        self._style_id = 0
+        self._pending.append(Control.set_scrolling_region(top + 1, bottom))
+        if delta > 0:
+            self._pending.append(Control.scroll_up(delta))
+            previous.text[top : bottom - delta] = previous.text[top + delta : bottom]
+            previous.style[top : bottom - delta] = previous.style[top + delta : bottom]
+            previous.clear(0, bottom - delta, None, delta)
+        else:
+            self._pending.append(Control.scroll_down(-delta))
+            previous.text[top - delta : bottom] = previous.text[top : bottom + delta]
+            previous.style[top - delta : bottom] = previous.style[top : bottom + delta]
+            previous.clear(0, top, None, -delta)
+        self._pending.append(Control.reset_scrolling_region())
+
+    def _is_full_repaint(self, canvas: Canvas) -> bool:
+        return self._previous is None or self._previous.text.shape != canvas.text.shape
+
+    def _diff(self, canvas: Canvas, regions: Iterable[Region] | None = None) -> str:
+        """Строит вывод, переводящий терминал из предыдущего кадра в canvas.
+
+        Если заданы regions (x, y, width, height), сравниваются только эти области кадра.
+        Обновляет отслеживаемое состояние SGR, поэтому результат должен быть записан в терминал.
+        """
+        previous = self._previous
+        parts: list[str] = []
+        if self._is_full_repaint(canvas):
+            self._pending.clear()
+            parts.append(_sgr(0) + Control.erase_data(2))
+            self._style_id = 0
+            changed = np.ones(canvas.text.shape, dtype=bool)
+        elif regions is None:
+            changed = (previous.text != canvas.text) | (previous.style != canvas.style)
+        else:
+            changed = np.zeros(canvas.text.shape, dtype=bool)
+            for x, y, width, height in regions:
+                area = np.s_[y : y + height, x : x + width]
+                changed[area] = (previous.text[area] != canvas.text[area]) | (
+                    previous.style[area] != canvas.style[area]
+                )
+
+        if profiler.enabled:
+            profiler.count('cells_changed', int(np.count_nonzero(changed)))
+        for row in np.flatnonzero(changed.any(axis=1)).tolist():
+            cols = np.flatnonzero(changed[row])
+            breaks = np.flatnonzero(np.diff(cols) > _MERGE_GAP)
+            starts = cols[np.concatenate(([0], breaks + 1))]
+            # A run never starts on the right half of a double-width character: its left half is redrawn too.
+            starts = (starts - (canvas.text[row, starts] == CONTINUATION)).tolist()
+            ends = (cols[np.concatenate((breaks, [len(cols) - 1]))] + 1).tolist()
+            for start, end in zip(starts, ends):
+                parts.append(Control.cursor_position(row + 1, start + 1))
+                self._run(parts, canvas.text[row, start:end], canvas.style[row, start:end])
+        return ''.join(parts)
+
+    def _run(self, parts: list[str], text: NDArray[np.str_], style: NDArray[np.uint16]) -> None:
+        bounds = [0, *(np.flatnonzero(style[1:] != style[:-1]) + 1).tolist(), len(text)]
+        for start, end in zip(bounds, bounds[1:]):
+            chunk = cells_text(''.join(text[start:end].tolist()))
+            if not chunk:
+                continue
+            style_id = int(style[start])
+            parts.append(sgr_encoder.transition(self._style_id, style_id))
+            self._style_id = style_id
+            parts.append(chunk)
+
+    def flush(self, canvas: Canvas, regions: Iterable[Region] | None = None) -> int:
+        """Выводит только изменившиеся ячейки одной записью и возвращает число записанных символов."""
+        output = self.update(canvas, regions)
+        if profiler.enabled:
+            profiler.count('bytes_flushed', len(output.encode()))
+        if output:
+            self._stream.write(output)
+            self._stream.flush()
+        return len(output)
+
+    def update(self, canvas: Canvas, regions: Iterable[Region] | None = None) -> str:
+        """Запоминает canvas как выведенный кадр и возвращает вывод для терминала, ничего не записывая."""
+        if regions is not None:
+            regions = list(regions)
+        body = self._diff(canvas, regions)
+        output = ''.join(self._pending) + body
+        self._pending.clear()
+        if regions is None or self._is_full_repaint(canvas):
+            self._previous = Canvas(canvas.text.copy(), canvas.style.copy())
+        else:
+            for x, y, width, height in regions:
+                area = np.s_[y : y + height, x : x + width]
+                self._previous.text[area] = canvas.text[area]
+                self._previous.style[area] = canvas.style[area]
+        return output
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from .style_ids import StyleTable, style_table
+from .styles import _ATTR_CODES, _ATTR_OFF, Style, Styles, _remember, _sgr
+
+
+def transition(current: Style, target: Style) -> str:
+    """Кратчайшая последовательность SGR, переводящая терминал из current в target, одним ESC[...m."""
+    if current is target:
+        return ''
+    reset = [0, *target.params()] if target is not Styles.EMPTY else [0]
+
+    removed = current.attrs & ~target.attrs
+    added = target.attrs & ~current.attrs
+    delta: list[int] = []
+    for code, flags in _ATTR_OFF.items():
+        if removed & flags:
+            delta.append(code)
+            # 22 clears both bold and dim; restore whichever of them should stay.
+            added |= current.attrs & target.attrs & flags
+    delta += [code for flag, code in _ATTR_CODES if added & flag]
+    if current.fg != target.fg:
+        delta += target.fg or (39,)
+    if current.bg != target.bg:
+        delta += target.bg or (49,)
+
+    params = delta if len(_sgr(*delta)) <= len(_sgr(*reset)) else reset
+    return _sgr(*params)
+
+
+class SgrEncoder:
+    """Кэширует переходы между стилями по id из StyleTable, не больше max_transitions последних."""
+
+    def __init__(self, table: StyleTable, max_transitions: int = 1 << 16):
+        self._table = table
+        self.max_transitions = max_transitions
+        self._transitions: dict[tuple[int, int], str] = {}
+
+    def transition(self, from_id: int, to_id: int) -> str:
+        key = (from_id, to_id)
+        sequence = self._transitions.get(key)
+        if sequence is None:
+            sequence = transition(self._table[from_id], self._table[to_id])
+            _remember(self._transitions, key, sequence, self.max_transitions)
+        return sequence
+
+
+sgr_encoder = SgrEncoder(style_table)
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import threading
+import warnings
+
+import numpy as np
+
+from .styles import MIX_CACHE_SIZE, Style, Styles, _remember
+
+# Two bytes per cell; past 65 536 distinct styles (per-cell RGB gradients) the table overflows, see StyleTable.
+STYLE_DTYPE = np.uint16
+
+
+class StyleTable:
+    """Интернирует стили: каждому различному Style сопоставляется небольшой целый id.
+
+    Плоскость стилей Canvas хранит именно эти id, id 0 всегда означает Styles.EMPTY.
+    Новые стили можно интернировать из любого потока.
+
+    Таблица не забывает стили (их id могут храниться где угодно), поэтому её размер ограничен max_styles:
+    сверх него новый стиль заменяется стилем с теми же атрибутами без цветов, а не обрывает кадр ошибкой.
+    """
+
+    def __init__(self, max_styles: int = 1 << 16):
+        # Ids beyond the dtype would wrap around in the style planes.
+        self.max_styles = min(max_styles, int(np.iinfo(STYLE_DTYPE).max) + 1)
+        self.overflowed = False
+        self._styles: list[Style] = [Styles.EMPTY]
+        self._ids: dict[Style, int] = {Styles.EMPTY: 0}
+        self._mixed: dict[tuple[int, ...], int] = {}
+        self._lock = threading.Lock()
+
+    def intern(self, style: Style | None) -> int:
+        if style is None:
+            return 0
+        style_id = self._ids.get(style)
+        if style_id is not None:
+            return style_id
+        with self._lock:
+            # Another thread may have interned it between the lookup and the lock.
+            style_id = self._ids.get(style)
+            if style_id is None:
+                if len(self._styles) >= self.max_styles:
+                    return self._overflow(style)
+                style_id = len(self._styles)
+                self._styles.append(style)
+                self._ids[style] = style_id
+        return style_id
+
+    def _overflow(self, style: Style) -> int:
+        if not self.overflowed:
+            self.overflowed = True
+            warnings.warn(
+                f'More than {self.max_styles} distinct styles; new colors are dropped', ResourceWarning, stacklevel=3
+            )
+        return self._ids.get(Style(attrs=style.attrs), 0)
+
+    def mix(self, *style_ids: int) -> int:
+        style_id = self._mixed.get(style_ids)
+        if style_id is None:
+            style_id = self.intern(Style.mix(*(self._styles[i] for i in style_ids)))
+            _remember(self._mixed, style_ids, style_id, MIX_CACHE_SIZE)
+        return style_id
+
+    def __getitem__(self, style_id: int) -> Style:
+        return self._styles[style_id]
+
+    def __len__(self) -> int:
+        return len(self._styles)
+
+
+style_table = StyleTable()
@@ -1,17 +1,26 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from framework.core import values
+from framework.core.values import Value, _set
 
-from pydantic.dataclasses import dataclass
+from .styles import Style, Styles
 
-if TYPE_CHECKING:
-    from . import Style, Styles
 
+class StyledText(Value):
+    __slots__ = ('text', 'style')
 
-@dataclass
-class StyledText:
     text: str
-    style: Style = Styles.EMPTY
+    style: Style
+
+    def __init__(self, text: str, style: Style = Styles.EMPTY):
+        _set(self, 'text', text)
+        _set(self, 'style', style)
+        if values.DEBUG:
+            self._validate()
+
+    def _validate(self) -> None:
+        if not isinstance(self.text, str) or not isinstance(self.style, Style):
+            raise TypeError(f'{self!r}: expected a str and a Style')
 
     def __len__(self):
         return len(self.text)
@@ -1,6 +1,11 @@
 from __future__ import annotations
 
-from pydantic.dataclasses import dataclass
+import re
+import weakref
+from functools import lru_cache
+
+from framework.core import values
+from framework.core.values import Value, _set
 
 
 def _csi(sign: str, *args: int) -> str:
@@ -11,28 +16,160 @@ def _sgr(*args: int) -> str:
     return _csi('m', *args)
 
 
-@dataclass(frozen=True, slots=True)
-class Style:
-    begin: str
-    end: str
+_sgr_regex = re.compile(r'\033\[(\d+(;\d+)*)?m')
+
+BOLD = 1 << 0
+DIM = 1 << 1
+ITALIC = 1 << 2
+UNDERLINE = 1 << 3
+BLINK = 1 << 4
+INVERSE = 1 << 5
+HIDDEN = 1 << 6
+STRIKETHROUGH = 1 << 7
+
+_ATTR_ON = {1: BOLD, 2: DIM, 3: ITALIC, 4: UNDERLINE, 5: BLINK, 7: INVERSE, 8: HIDDEN, 9: STRIKETHROUGH}
+_ATTR_OFF = {22: BOLD | DIM, 23: ITALIC, 24: UNDERLINE, 25: BLINK, 27: INVERSE, 28: HIDDEN, 29: STRIKETHROUGH}
+_ATTR_CODES = [(flag, code) for code, flag in _ATTR_ON.items()]
+
+Color = tuple[int, ...]
+
+# Every distinct (fg, bg, attrs) maps to a single live Style object, so styles compare and mix by identity.
+# Weak: per-cell colors (gradients, heat maps) would otherwise keep every style ever made alive.
+_interned: weakref.WeakValueDictionary[tuple[Color, Color, int], Style] = weakref.WeakValueDictionary()
+# Recently made styles are kept alive, so a style rebuilt every frame is not constructed anew each time.
+_recent: dict[tuple[Color, Color, int], Style] = {}
+# Style.mix results keyed by the operands themselves, which keeps them alive while the entry is cached.
+_mixed: dict[tuple[Style, ...], Style] = {}
+# Entries of _recent and _mixed beyond these are evicted oldest first.
+RECENT_STYLES = 1 << 14
+MIX_CACHE_SIZE = 1 << 14
+
+
+class Style(Value):
+    """Стиль текста: цвета как параметры SGR и битовая маска атрибутов.
+
+    Экземпляры интернируются: одинаковые (fg, bg, attrs) всегда дают один и тот же объект.
+    """
+
+    __slots__ = ('fg', 'bg', 'attrs', '_begin', '_end', '__weakref__')
+
+    fg: Color
+    bg: Color
+    attrs: int
+
+    def __new__(cls, fg: Color = (), bg: Color = (), attrs: int = 0) -> Style:
+        key = (fg, bg, attrs)
+        style = _recent.get(key) or _interned.get(key)
+        if style is None:
+            style = object.__new__(cls)
+            _set(style, 'fg', fg)
+            _set(style, 'bg', bg)
+            _set(style, 'attrs', attrs)
+            if values.DEBUG:
+                style._validate()
+            params = style.params()
+            _set(style, '_begin', _sgr(*params) if params else '')
+            off = [code for code, flags in _ATTR_OFF.items() if attrs & flags]
+            off += [39] if fg else []
+            off += [49] if bg else []
+            _set(style, '_end', _sgr(*off) if off else '')
+            _interned[key] = style
+            _remember(_recent, key, style, RECENT_STYLES)
+        return style
+
+    def _validate(self) -> None:
+        for color in (self.fg, self.bg):
+            if not isinstance(color, tuple) or not all(isinstance(code, int) for code in color):
+                raise TypeError(f'{self!r}: colors must be tuples of SGR parameters')
+        if not isinstance(self.attrs, int) or self.attrs & ~0xFF:
+            raise TypeError(f'{self!r}: attrs must be a bitmask of attribute flags')
+
+    @property
+    def begin(self) -> str:
+        """Последовательность SGR, включающая стиль."""
+        return self._begin
+
+    @property
+    def end(self) -> str:
+        """Последовательность SGR, выключающая стиль."""
+        return self._end
+
+    def params(self) -> list[int]:
+        result = [code for flag, code in _ATTR_CODES if self.attrs & flag]
+        return result + list(self.fg) + list(self.bg)
+
+    @staticmethod
+    def parse(sequence: str) -> Style:
+        """Стиль, который последовательность SGR устанавливает поверх состояния по умолчанию."""
+        fg: Color = ()
+        bg: Color = ()
+        attrs = 0
+        for match in _sgr_regex.finditer(sequence):
+            codes = [int(code) for code in match.group(1).split(';')] if match.group(1) else [0]
+            i = 0
+            while i < len(codes):
+                code = codes[i]
+                if code in (38, 48):
+                    length = 5 if codes[i + 1 : i + 2] == [2] else 3
+                    color = tuple(codes[i : i + length])
+                    fg, bg = (color, bg) if code == 38 else (fg, color)
+                    i += length
+                    continue
+                if code == 0:
+                    fg, bg, attrs = (), (), 0
+                elif code in _ATTR_ON:
+                    attrs |= _ATTR_ON[code]
+                elif code in _ATTR_OFF:
+                    attrs &= ~_ATTR_OFF[code]
+                elif code == 39:
+                    fg = ()
+                elif code == 49:
+                    bg = ()
+                elif 30 <= code <= 37 or 90 <= code <= 97:
+                    fg = (code,)
+                elif 40 <= code <= 47 or 100 <= code <= 107:
+                    bg = (code,)
+                i += 1
+        return Style(fg, bg, attrs)
 
     @staticmethod
     def mix(*styles: Style) -> Style:
-        return Style(
-            ''.join(style.begin for style in styles),
-            ''.join(style.end for style in styles),
-        )
+        """Накладывает стили по порядку: атрибуты объединяются, цвет берётся из последнего задавшего его стиля."""
+        style = _mixed.get(styles)
+        if style is not None:
+            return style
+        # Canonical operands: without empty styles and keeping only the last occurrence of repeated ones.
+        operands = tuple(s for i, s in enumerate(styles) if s is not Styles.EMPTY and s not in styles[i + 1 :])
+        style = _mixed.get(operands)
+        if style is None:
+            fg: Color = ()
+            bg: Color = ()
+            attrs = 0
+            for operand in operands:
+                fg = operand.fg or fg
+                bg = operand.bg or bg
+                attrs |= operand.attrs
+            style = Style(fg, bg, attrs)
+            _remember(_mixed, operands, style, MIX_CACHE_SIZE)
+        _remember(_mixed, styles, style, MIX_CACHE_SIZE)
+        return style
 
     def mix_with(self, other: Style) -> Style:
         return Style.mix(self, other)
 
 
+def _remember(cache: dict, key, value, limit: int) -> None:
+    # Dicts keep insertion order, so the first key is the oldest one; another thread may have evicted it already.
+    if len(cache) >= limit:
+        cache.pop(next(iter(cache), None), None)
+    cache[key] = value
+
+
 def _meta_colors(bright: int, bg: bool):
     base = 30 + int(bright) * 60 + int(bg) * 10
-    end = 39 + int(bg) * 10
 
     def construct(add_code: int) -> Style:
-        return Style(_sgr(base + add_code), _sgr(end))
+        return Style(bg=(base + add_code,)) if bg else Style(fg=(base + add_code,))
 
     class MetaColor:
         BLACK = construct(0)
@@ -47,20 +184,21 @@ def _meta_colors(bright: int, bg: bool):
     return MetaColor
 
 
-def _meta_rgb(fg: bool):
+def _meta_rgb(bg: bool):
     class MetaRGB:
         @staticmethod
         def from_rgb(r: int, g: int, b: int):
-            return Style(_sgr((38 if fg else 48), 2, r, g, b), _sgr(39 if fg else 49))
+            return Style(bg=(48, 2, r, g, b)) if bg else Style(fg=(38, 2, r, g, b))
 
         @staticmethod
+        @lru_cache(maxsize=4096)
         def from_hex(hex_color: str):
             color = hex_color.lstrip('#')
             if len(color) == 2:
                 color *= 3
             if len(color) == 3:
                 color = ''.join([c * 2 for c in color])
-            r, g, b = tuple(int(hex_color[i : i + 2], 16) for i in (0, 2, 4))
+            r, g, b = tuple(int(color[i : i + 2], 16) for i in (0, 2, 4))
             return MetaRGB.from_rgb(r, g, b)
 
     return MetaRGB
@@ -77,10 +215,10 @@ class Styles:
         ConsoleBright = _meta_colors(True, True)
         RGB = _meta_rgb(True)
 
-    EMPTY = Style('', '')
-    BOLD = Style(_sgr(1), _sgr(22))
-    ITALIC = Style(_sgr(3), _sgr(23))
-    UNDERLINE = Style(_sgr(4), _sgr(24))
-    BLINK = Style(_sgr(5), _sgr(25))
-    INVERSE = Style(_sgr(7), _sgr(27))
-    STRIKETHROUGH = Style(_sgr(9), _sgr(29))
+    EMPTY = Style()
+    BOLD = Style(attrs=BOLD)
+    ITALIC = Style(attrs=ITALIC)
+    UNDERLINE = Style(attrs=UNDERLINE)
+    BLINK = Style(attrs=BLINK)
+    INVERSE = Style(attrs=INVERSE)
+    STRIKETHROUGH = Style(attrs=STRIKETHROUGH)
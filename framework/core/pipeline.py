@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, List, Optional
+
+from framework.core.concepts import Constraints, SizeBox
+
+if TYPE_CHECKING:
+    from framework.core.render_object import RenderObject
+
+
+class PipelineOwner:
+    """Владелец дерева рендер-объектов: собирает границы релэйаута, требующие пересчёта."""
+
+    def __init__(self):
+        self.root: Optional[RenderObject] = None
+        self._needs_layout: List[RenderObject] = []
+
+    def set_root(self, root: RenderObject):
+        self.root = root
+        root.attach(self)
+
+    def schedule_layout(self, render_object: RenderObject):
+        self._needs_layout.append(render_object)
+
+    def layout_root(self, size: SizeBox):
+        """Раскладывает дерево под размер терминала, например после SIGWINCH."""
+        assert self.root is not None
+        self.root.layout(Constraints.tight(size))
+        self.flush_layout()
+
+    def flush_layout(self):
+        while self._needs_layout:
+            dirty = sorted(self._needs_layout, key=lambda render_object: render_object.depth)
+            self._needs_layout = []
+            for render_object in dirty:
+                if render_object._needs_layout and render_object.owner is self:
+                    render_object._relayout()
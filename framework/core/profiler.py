@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+import time
+from typing import Any, Callable
+
+
+class Span:
+    """Отрезок времени, потраченный объектом (виджетом, рендер-объектом) на одну фазу кадра."""
+
+    __slots__ = ('name', 'phase', 'start', 'duration', 'self_time', 'depth')
+
+    def __init__(self, name: str, phase: str, start: float, duration: float, self_time: float, depth: int):
+        self.name = name
+        self.phase = phase
+        self.start = start
+        self.duration = duration
+        # Duration minus the spans nested in this one, e.g. without the children a Padding paints.
+        self.self_time = self_time
+        self.depth = depth
+
+
+class FrameProfile:
+    """Всё, что профайлер узнал об одном кадре: вложенные отрезки времени и счётчики."""
+
+    def __init__(self, index: int, start: float):
+        self.index = index
+        self.start = start
+        self.duration = 0.0
+        self.spans: list[Span] = []
+        self.counters: dict[str, int] = {}
+
+    @property
+    def cache_hit_rate(self) -> float | None:
+        hits = self.counters.get('cache_hits', 0)
+        total = hits + self.counters.get('cache_misses', 0)
+        return hits / total if total else None
+
+    def totals(self, phase: str = 'render') -> list[tuple[str, float]]:
+        """Суммарное собственное время по именам в фазе, от самых медленных."""
+        totals: dict[str, float] = {}
+        for span in self.spans:
+            if span.phase == phase:
+                totals[span.name] = totals.get(span.name, 0.0) + span.self_time
+        return sorted(totals.items(), key=lambda item: item[1], reverse=True)
+
+
+class _NullContext:
+    def __enter__(self) -> None:
+        pass
+
+    def __exit__(self, *exc_info: Any) -> None:
+        pass
+
+
+_NULL = _NullContext()
+
+
+class _SpanContext:
+    __slots__ = ('_profiler', '_owner', '_phase', '_start')
+
+    def __init__(self, profiler: Profiler, owner: object, phase: str):
+        self._profiler = profiler
+        self._owner = owner
+        self._phase = phase
+
+    def __enter__(self) -> None:
+        self._profiler._nested.append(0.0)
+        self._start = self._profiler.clock()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        profiler = self._profiler
+        duration = profiler.clock() - self._start
+        nested = profiler._nested.pop()
+        if profiler._nested:
+            profiler._nested[-1] += duration
+        if profiler._frame is not None:
+            profiler._frame.spans.append(
+                Span(_name(self._owner), self._phase, self._start, duration, duration - nested, len(profiler._nested))
+            )
+
+
+class _FrameContext:
+    __slots__ = ('_profiler',)
+
+    def __init__(self, profiler: Profiler):
+        self._profiler = profiler
+
+    def __enter__(self) -> None:
+        profiler = self._profiler
+        profiler._frame = FrameProfile(profiler.frames, profiler.clock())
+
+    def __exit__(self, *exc_info: Any) -> None:
+        profiler = self._profiler
+        frame, profiler._frame = profiler._frame, None
+        assert frame is not None
+        frame.duration = profiler.clock() - frame.start
+        profiler.frames += 1
+        profiler.last = frame
+        for subscriber in tuple(profiler._subscribers):
+            subscriber(frame)
+
+
+def _name(owner: object) -> str:
+    name = type(owner).__name__
+    owner_id = getattr(owner, 'id', None)
+    return f'{name}#{owner_id}' if isinstance(owner_id, str) else name
+
+
+class Profiler:
+    """Необязательная инструментация конвейера отрисовки.
+
+    Пока никто не подписан, span и frame возвращают пустой контекст и ничего не измеряют.
+    Подписчики получают FrameProfile по окончании каждого кадра.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter):
+        self.clock = clock
+        self.frames = 0
+        self.last: FrameProfile | None = None
+        self._subscribers: list[Callable[[FrameProfile], None]] = []
+        self._frame: FrameProfile | None = None
+        # Time spent in finished nested spans, one entry per open span.
+        self._nested: list[float] = []
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._subscribers)
+
+    def subscribe(self, subscriber: Callable[[FrameProfile], None]) -> Callable[[], None]:
+        """Подписывает на профили кадров и возвращает функцию отписки."""
+        self._subscribers.append(subscriber)
+        return lambda: self._subscribers.remove(subscriber)
+
+    def frame(self) -> _FrameContext | _NullContext:
+        """Контекст одного кадра; вложенные кадры не открываются."""
+        if not self._subscribers or self._frame is not None:
+            return _NULL
+        return _FrameContext(self)
+
+    def span(self, owner: object, phase: str) -> _SpanContext | _NullContext:
+        """Измеряет фазу (render, paint, layout) объекта owner внутри текущего кадра."""
+        if self._frame is None:
+            return _NULL
+        return _SpanContext(self, owner, phase)
+
+    def count(self, counter: str, value: int = 1) -> None:
+        if self._frame is not None:
+            self._frame.counters[counter] = self._frame.counters.get(counter, 0) + value
+
+
+profiler = Profiler()
+
+
+class ChromeTraceExporter:
+    """Собирает профили кадров в формате Chrome Trace Event (chrome://tracing, Perfetto)."""
+
+    def __init__(self, max_frames: int | None = None):
+        self.max_frames = max_frames
+        self.frames = 0
+        self._events: list[dict[str, Any]] = []
+        self._origin: float | None = None
+
+    def __call__(self, frame: FrameProfile) -> None:
+        if self.max_frames is not None and self.frames >= self.max_frames:
+            return
+        self.frames += 1
+        if self._origin is None:
+            self._origin = frame.start
+        us = 1e6
+        self._events.append(
+            {
+                'name': f'frame {frame.index}',
+                'cat': 'frame',
+                'ph': 'X',
+                'ts': (frame.start - self._origin) * us,
+                'dur': frame.duration * us,
+                'pid': 0,
+                'tid': 0,
+                'args': dict(frame.counters),
+            }
+        )
+        for span in frame.spans:
+            self._events.append(
+                {
+                    'name': span.name,
+                    'cat': span.phase,
+                    'ph': 'X',
+                    'ts': (span.start - self._origin) * us,
+                    'dur': span.duration * us,
+                    'pid': 0,
+                    'tid': 0,
+                }
+            )
+        if frame.counters:
+            self._events.append(
+                {
+                    'name': 'counters',
+                    'ph': 'C',
+                    'ts': (frame.start - self._origin) * us,
+                    'pid': 0,
+                    'args': dict(frame.counters),
+                }
+            )
+
+    def save(self, path: str) -> None:
+        import json
+
+        with open(path, 'w') as file:
+            json.dump({'traceEvents': self._events, 'displayTimeUnit': 'ms'}, file)
+
+
+class FrameLogger:
+    """Пишет сводку кадра в loguru.
+
+    Чтобы запись не искажала время кадров, приёмники loguru должны быть добавлены с enqueue=True:
+    тогда форматирование и запись в файл выполняются в отдельном потоке.
+    """
+
+    def __init__(self, slow_ms: float | None = None, top: int = 3):
+        self.slow_ms = slow_ms
+        self.top = top
+
+    def __call__(self, frame: FrameProfile) -> None:
+        duration_ms = frame.duration * 1e3
+        if self.slow_ms is not None and duration_ms < self.slow_ms:
+            return
+        from loguru import logger
+
+        hit_rate = frame.cache_hit_rate
+        widgets = ', '.join(f'{name} {seconds * 1e3:.2f} ms' for name, seconds in frame.totals()[: self.top])
+        summary = (
+            f'Frame {frame.index}: {duration_ms:.2f} ms'
+            f', cache {"-" if hit_rate is None else f"{hit_rate:.0%}"}'
+            f', {frame.counters.get("cells_changed", 0)} cells'
+            f', {frame.counters.get("bytes_flushed", 0)} B'
+        )
+        logger.debug(f'{summary}; {widgets}' if widgets else summary)
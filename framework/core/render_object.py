@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, List, Optional
 
-from framework.core.concepts import Position, SizeBox
+from framework.core.profiler import profiler
+from framework.core.concepts import Constraints, Position, SizeBox
 
 if TYPE_CHECKING:
     from framework.core.element import Element
+    from framework.core.pipeline import PipelineOwner
     from framework.core.widget import Widget
 
 
@@ -15,15 +17,97 @@ class RenderObject(ABC):
 
     def __init__(self):
         self.element: Optional[Element] = None
-        self._constraints: Optional[SizeBox] = None
+        self.parent: Optional[RenderObject] = None
+        self.children: List[RenderObject] = []
+        self.depth = 0
+        self.owner: Optional[PipelineOwner] = None
+        self._constraints: Optional[Constraints] = None
         self._size: Optional[SizeBox] = None
         self._position: Optional[Position] = None
+        self._needs_layout = True
+        self._relayout_boundary: Optional[RenderObject] = None
+
+    @property
+    def size(self) -> SizeBox:
+        assert self._size is not None, 'Render object has not been laid out'
+        return self._size
+
+    @property
+    def position(self) -> Position:
+        """Позиция относительно родителя, назначается родителем во время его layout."""
+        return self._position if self._position is not None else Position(x=0, y=0)
+
+    @position.setter
+    def position(self, position: Position):
+        self._position = position
+
+    def layout(self, constraints: Constraints, parent_uses_size: bool = False) -> SizeBox:
+        """Вычисляет layout рендер-объекта в заданных ограничениях.
+
+        Результат кэшируется: при тех же ограничениях и отсутствии изменений layout не пересчитывается.
+        Объект становится границей релэйаута, если его размер не влияет на родителя.
+        """
+        if not parent_uses_size or constraints.is_tight or self.parent is None:
+            boundary = self
+        else:
+            boundary = self.parent._relayout_boundary
+        if not self._needs_layout and constraints == self._constraints and boundary is self._relayout_boundary:
+            return self.size
+        self._constraints = constraints
+        self._relayout_boundary = boundary
+        with profiler.span(self, 'layout'):
+            self._size = self.perform_layout(constraints)
+        self._needs_layout = False
+        return self._size
 
     @abstractmethod
-    def layout(self, constraints: SizeBox):
-        """Вычисляет layout рендер-объекта в заданных ограничениях."""
+    def perform_layout(self, constraints: Constraints) -> SizeBox:
+        """Раскладывает детей (layout и position) и возвращает собственный размер."""
         pass
 
+    def mark_needs_layout(self):
+        if self._needs_layout:
+            return
+        self._needs_layout = True
+        if self._relayout_boundary is not self and self.parent is not None:
+            self.parent.mark_needs_layout()
+        elif self.owner is not None:
+            self.owner.schedule_layout(self)
+
+    def attach(self, owner: Optional[PipelineOwner]):
+        if self.owner is owner:
+            return
+        self.owner = owner
+        for child in self.children:
+            child.attach(owner)
+
+    def set_children(self, children: List[RenderObject]):
+        if len(children) == len(self.children) and all(a is b for a, b in zip(children, self.children)):
+            return
+        kept = set(map(id, children))
+        for child in self.children:
+            if id(child) not in kept and child.parent is self:
+                child.parent = None
+                child.attach(None)
+        for child in children:
+            child.parent = self
+            child._set_depth(self.depth + 1)
+            child.attach(self.owner)
+        self.children = children
+        self.mark_needs_layout()
+
+    def _set_depth(self, depth: int):
+        if self.depth != depth:
+            self.depth = depth
+            for child in self.children:
+                child._set_depth(depth + 1)
+
+    def _relayout(self):
+        assert self._constraints is not None
+        with profiler.span(self, 'layout'):
+            self._size = self.perform_layout(self._constraints)
+        self._needs_layout = False
+
     # @abstractmethod
     # def render(self) -> Canvas:
     #     """Отрисовывает рендер-объект на заданном холсте."""
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import os
+from typing import Any, ClassVar, Iterator
+
+# Validation of value types is opt-in: it costs more than constructing the value itself.
+DEBUG = os.environ.get('FRAMEWORK_DEBUG', '') not in ('', '0')
+
+_set = object.__setattr__
+
+
+class Value:
+    """Лёгкий неизменяемый тип-значение на __slots__ с кэшируемым хэшем.
+
+    Поля задаются через __slots__ подкласса и присваиваются в __init__ через object.__setattr__.
+    Слоты с именами на '_' служат кэшами и в поля значения не входят.
+    Проверки значений выполняются в _validate и только при включённом DEBUG.
+    """
+
+    __slots__ = ('_hash',)
+    _fields: ClassVar[tuple[str, ...]] = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._fields = tuple(
+            field
+            for klass in reversed(cls.__mro__)
+            for field in klass.__dict__.get('__slots__', ())
+            if not field.startswith('_')
+        )
+
+    def _validate(self) -> None:
+        pass
+
+    def _astuple(self) -> tuple[Any, ...]:
+        return tuple(getattr(self, field) for field in self._fields)
+
+    def _replace(self, **changes: Any) -> Value:
+        return type(self)(**{field: changes.get(field, getattr(self, field)) for field in self._fields})
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f'{type(self).__name__} is immutable')
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f'{type(self).__name__} is immutable')
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._astuple() == other._astuple()  # type: ignore[attr-defined]
+
+    def __hash__(self) -> int:
+        try:
+            return self._hash
+        except AttributeError:
+            value_hash = hash((self.__class__, self._astuple()))
+            _set(self, '_hash', value_hash)
+            return value_hash
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._astuple())
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return self.__class__, self._astuple()
+
+    def __repr__(self) -> str:
+        fields = ', '.join(f'{field}={getattr(self, field)!r}' for field in self._fields)
+        return f'{type(self).__name__}({fields})'
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Sequence
 
 if TYPE_CHECKING:
-    from framework.core import Element
+    from framework.core import Element, RenderObject
 
 
 class Widget(ABC):
@@ -20,3 +20,19 @@ class Widget(ABC):
     @abstractmethod
     def can_update(self, old_widget: Widget) -> bool:
         pass
+
+
+class RenderObjectWidget(Widget):
+    children: Sequence[Widget] = ()
+
+    def create_element(self) -> Element:
+        from framework.core.element import RenderObjectElement
+
+        return RenderObjectElement(self)
+
+    def can_update(self, old_widget: Widget) -> bool:
+        return type(old_widget) is type(self) and old_widget.key == self.key
+
+    @abstractmethod
+    def create_render_object(self) -> RenderObject:
+        pass
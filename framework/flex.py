@@ -1,5 +1,128 @@
-from framework.core.widget import Widget
+from __future__ import annotations
 
+from enum import Enum
+from typing import Optional, Sequence
 
-class Column(Widget):
-    
\ No newline at end of file
+from framework.core.concepts import Constraints, Position, SizeBox
+from framework.core.render_object import RenderObject
+from framework.core.widget import RenderObjectWidget, Widget
+
+
+class Axis(Enum):
+    HORIZONTAL = 'horizontal'
+    VERTICAL = 'vertical'
+
+
+class Flex(RenderObjectWidget):
+    def __init__(self, *, direction: Axis, children: Sequence[Widget] = (), key: str | None = None) -> None:
+        super().__init__(key)
+        self.direction = direction
+        self.children = children
+
+    def create_render_object(self) -> RenderObject:
+        return RenderFlex(self.direction)
+
+
+class Column(Flex):
+    def __init__(self, *, children: Sequence[Widget] = (), key: str | None = None) -> None:
+        super().__init__(direction=Axis.VERTICAL, children=children, key=key)
+
+
+class Row(Flex):
+    def __init__(self, *, children: Sequence[Widget] = (), key: str | None = None) -> None:
+        super().__init__(direction=Axis.HORIZONTAL, children=children, key=key)
+
+
+class Flexible(RenderObjectWidget):
+    """Отдаёт ребёнку долю свободного места вдоль главной оси Flex пропорционально flex."""
+
+    def __init__(self, *, child: Widget, flex: int = 1, key: str | None = None) -> None:
+        super().__init__(key)
+        self.flex = flex
+        self.children = (child,)
+
+    def create_render_object(self) -> RenderObject:
+        return RenderFlexible(self.flex)
+
+
+class RenderFlex(RenderObject):
+    def __init__(self, direction: Axis):
+        super().__init__()
+        self.direction = direction
+
+    def update(self, new_widget: Widget):
+        assert isinstance(new_widget, Flex)
+        if new_widget.direction != self.direction:
+            self.direction = new_widget.direction
+            self.mark_needs_layout()
+
+    def _child_constraints(self, min_main: int, max_main: int, max_cross: int) -> Constraints:
+        if self.direction is Axis.VERTICAL:
+            return Constraints(min_width=0, max_width=max_cross, min_height=min_main, max_height=max_main)
+        return Constraints(min_width=min_main, max_width=max_main, min_height=0, max_height=max_cross)
+
+    def _main_cross(self, size: SizeBox) -> tuple[int, int]:
+        if self.direction is Axis.VERTICAL:
+            return size.height, size.width
+        return size.width, size.height
+
+    def perform_layout(self, constraints: Constraints) -> SizeBox:
+        vertical = self.direction is Axis.VERTICAL
+        max_main = constraints.max_height if vertical else constraints.max_width
+        max_cross = constraints.max_width if vertical else constraints.max_height
+
+        sizes: list[Optional[SizeBox]] = [None] * len(self.children)
+        allocated = 0
+        total_flex = 0
+        for index, child in enumerate(self.children):
+            if isinstance(child, RenderFlexible) and child.flex > 0:
+                total_flex += child.flex
+                continue
+            sizes[index] = child.layout(
+                self._child_constraints(0, max(max_main - allocated, 0), max_cross), parent_uses_size=True
+            )
+            allocated += self._main_cross(sizes[index])[0]
+
+        free = max(max_main - allocated, 0)
+        remaining_flex = total_flex
+        for index, child in enumerate(self.children):
+            if sizes[index] is not None:
+                continue
+            assert isinstance(child, RenderFlexible)
+            share = free * child.flex // remaining_flex
+            free -= share
+            remaining_flex -= child.flex
+            sizes[index] = child.layout(self._child_constraints(share, share, max_cross), parent_uses_size=True)
+
+        offset = 0
+        cross = 0
+        for child, size in zip(self.children, sizes):
+            assert size is not None
+            child.position = Position(x=0, y=offset) if vertical else Position(x=offset, y=0)
+            child_main, child_cross = self._main_cross(size)
+            offset += child_main
+            cross = max(cross, child_cross)
+
+        main = max_main if total_flex else offset
+        return constraints.constrain(cross, main) if vertical else constraints.constrain(main, cross)
+
+
+class RenderFlexible(RenderObject):
+    def __init__(self, flex: int):
+        super().__init__()
+        self.flex = flex
+
+    def update(self, new_widget: Widget):
+        assert isinstance(new_widget, Flexible)
+        if new_widget.flex != self.flex:
+            self.flex = new_widget.flex
+            if self.parent is not None:
+                self.parent.mark_needs_layout()
+
+    def perform_layout(self, constraints: Constraints) -> SizeBox:
+        if not self.children:
+            return constraints.constrain(0, 0)
+        child = self.children[0]
+        child.position = Position(x=0, y=0)
+        size = child.layout(constraints, parent_uses_size=True)
+        return constraints.constrain(size.width, size.height)
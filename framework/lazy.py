@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from importlib import import_module
+from typing import Any, Callable
+
+
+def lazy_exports(
+    namespace: dict[str, Any], exports: dict[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """__getattr__ и __dir__ для __init__ пакета, импортирующего экспортируемые имена при первом обращении.
+
+    namespace — globals() пакета, exports — {имя: относительный модуль}. Импортированное значение
+    сохраняется в namespace, так что следующие обращения к нему уже не доходят до __getattr__.
+    """
+    package = namespace['__name__']
+
+    def __getattr__(name: str) -> Any:
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(f'module {package!r} has no attribute {name!r}')
+        value = namespace[name] = getattr(import_module(module, package), name)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted({*namespace, *namespace.get('__all__', ())})
+
+    return __getattr__, __dir__
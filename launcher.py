@@ -1,6 +1,10 @@
+import hashlib
+import json
 import os
+import re
 import subprocess
 import sys
+import tempfile
 from pathlib import Path
 
 
@@ -14,6 +18,7 @@ class Global:
         python_bin = Path(sys.executable)
     python_path = here
     script = here / 'main.py'
+    wheel_dir = here / 'wheels'
     
     @staticmethod
     def read_conf():
@@ -32,6 +37,8 @@ class Global:
                 Global.python_path = Global.here / value
             if key == 'script':
                 Global.script = Global.here / value
+            if key == 'wheel_dir':
+                Global.wheel_dir = Global.here / value
 
 
 
@@ -43,21 +50,116 @@ def clear_screen():
 def create_venv():
     clear_screen()
     print('\n📦 Создаём виртуальное окружение...\n')
-    subprocess.check_call([sys.executable, '-m', 'venv', str(Global.venv_dir)])
+    subprocess.check_call([sys.executable, '-m', 'venv', '--clear', str(Global.venv_dir)])
 
 
-def install_requirements():
+def fingerprint_file():
+    return Global.venv_dir / '.launcher-fingerprint'
+
+
+def requirement_lines():
+    lines = Global.requirements.read_text().splitlines()
+    return sorted({line.split('#', 1)[0].strip() for line in lines} - {''})
+
+
+def requirement_name(line):
+    match = re.match(r'[A-Za-z0-9._-]+', line)
+    return match.group(0).lower() if match else None
+
+
+def current_fingerprint():
+    return {
+        # The venv belongs to the interpreter it was created from; a different one means a new venv.
+        'interpreter': f'{sys.executable} {sys.version}',
+        'hash': hashlib.sha256(Global.requirements.read_bytes()).hexdigest(),
+        'requirements': requirement_lines(),
+    }
+
+
+def stored_fingerprint():
+    try:
+        return json.loads(fingerprint_file().read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def pip(*args):
+    subprocess.check_call([str(Global.python_bin), '-m', 'pip', *args, '--disable-pip-version-check'])
+
+
+def install_requirements(stored, current):
+    """Доустанавливает только изменившиеся строки requirements и удаляет пакеты, исчезнувшие из него."""
     clear_screen()
-    print('\n📥 Устанавливаем зависимости...\n')
-    subprocess.check_call([str(Global.python_bin), '-m', 'pip', 'install', '--upgrade', 'pip'])
-    subprocess.check_call([str(Global.python_bin), '-m', 'pip', 'install', '-r', str(Global.requirements)])
+    print('\n📥 Синхронизируем зависимости...\n')
+    previous = set(stored['requirements']) if stored else set()
+    added = [line for line in current['requirements'] if line not in previous]
+    kept = {requirement_name(line) for line in current['requirements']}
+    removed = {requirement_name(line) for line in previous.difference(current['requirements'])} - kept - {None}
+    if removed:
+        pip('uninstall', '-y', *sorted(removed))
+    if added:
+        with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False) as file:
+            file.write('\n'.join(added))
+        try:
+            offline = ['--no-index', '--find-links', str(Global.wheel_dir)] if Global.wheel_dir.is_dir() else []
+            pip('install', *offline, '-r', file.name)
+        finally:
+            os.unlink(file.name)
+    fingerprint_file().write_text(json.dumps(current))
+
+
+def import_tree(stderr):
+    """Разбирает вывод -X importtime в дерево узлов (имя, собственное время, полное время, дети).
+
+    Время в микросекундах. Строки stderr, не относящиеся к importtime, возвращаются отдельно.
+    """
+    pending = {}
+    other = []
+    for line in stderr.splitlines():
+        match = re.match(r'import time:\s+(\d+) \|\s+(\d+) \|( +)(\S+)', line)
+        if match is None:
+            if not line.startswith('import time:'):
+                other.append(line)
+            continue
+        level = (len(match.group(3)) - 1) // 2
+        # importtime prints a module after everything it imported, one level deeper.
+        node = (match.group(4), int(match.group(1)), int(match.group(2)), pending.pop(level + 1, []))
+        pending.setdefault(level, []).append(node)
+    return pending.get(0, []), other
+
+
+def format_import_tree(nodes, depth=0, threshold_us=500):
+    lines = []
+    for name, self_us, total_us, children in sorted(nodes, key=lambda node: node[2], reverse=True):
+        if total_us < threshold_us:
+            break
+        lines.append(f'{"  " * depth}{total_us / 1000:8.1f} ms  {name} (self {self_us / 1000:.1f} ms)')
+        lines += format_import_tree(children, depth + 1, threshold_us)
+    return lines
+
+
+def profile_startup(args, env):
+    """Запускает приложение с -X importtime и дописывает отсортированное дерево импортов в app.log."""
+    result = subprocess.run([args[0], '-X', 'importtime', *args[1:]], env=env, stderr=subprocess.PIPE, text=True)
+    roots, other = import_tree(result.stderr)
+    total = sum(node[2] for node in roots)
+    with open(Global.here / 'app.log', 'a', encoding='utf-8') as log:
+        log.write(f'Startup imports of {Global.script.name}: {total / 1000:.1f} ms\n')
+        log.write('\n'.join(format_import_tree(roots)) + '\n')
+    if other:
+        print('\n'.join(other), file=sys.stderr)
 
 
 def main():
     Global.read_conf()
-    if Global.requirements.exists() and not Global.python_bin.exists():
-        create_venv()
-        install_requirements()
+    if Global.requirements.exists():
+        stored = stored_fingerprint() if Global.python_bin.exists() else None
+        current = current_fingerprint()
+        if not Global.python_bin.exists() or stored is not None and stored['interpreter'] != current['interpreter']:
+            create_venv()
+            stored = None
+        if stored is None or stored['hash'] != current['hash']:
+            install_requirements(stored, current)
     if not Global.script.exists():
         print(f'🚨 Скрипт {Global.script} не найден. Проверьте конфигурацию.')
         return
@@ -71,9 +173,16 @@ def main():
     env['APP_ROOT_DIR'] = str(Global.here)
 
     clear_screen()
-    # os.execve(str(Global.python_bin), [str(Global.python_bin), str(Global.script)], env)
-
-    subprocess.run([str(Global.python_bin), str(Global.script)] + sys.argv[1:], env=env)
+    argv = sys.argv[1:]
+    profile = '--profile-startup' in argv
+    args = [str(Global.python_bin), str(Global.script)] + [arg for arg in argv if arg != '--profile-startup']
+    if profile:
+        profile_startup(args, env)
+    elif os.name == 'nt':
+        # On Windows execve starts a new process instead of replacing this one, so wait for the app as before.
+        subprocess.run(args, env=env)
+    else:
+        os.execve(str(Global.python_bin), args, env)
 
 
 if __name__ == '__main__':
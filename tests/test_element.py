@@ -0,0 +1,157 @@
+import unittest
+
+from framework.core import RenderObject, RenderObjectWidget
+
+
+class Box(RenderObjectWidget):
+    def __init__(self, key=None, children=()):
+        super().__init__(key)
+        self.children = children
+
+    def create_render_object(self):
+        return RenderBox()
+
+
+class Other(Box):
+    pass
+
+
+class RenderBox(RenderObject):
+    def __init__(self):
+        super().__init__()
+        self.updates = 0
+
+    def update(self, new_widget):
+        self.updates += 1
+
+    def perform_layout(self, constraints):
+        return constraints.constrain(0, 0)
+
+
+def _mount(*children):
+    root = Box(children=children).create_element()
+    root.mount(None)
+    return root
+
+
+class _ElementTest(unittest.TestCase):
+    def assertDetached(self, element):
+        self.assertIsNone(element.parent)
+        self.assertIsNone(element._render_object)
+        self.assertEqual(element.children, [])
+
+    def assertRenderChildren(self, element):
+        self.assertEqual(element._render_object.children, [child._render_object for child in element.children])
+
+
+class UpdateChildrenTest(_ElementTest):
+    def test_keyed_children_are_reused_when_reordered(self):
+        root = _mount(Box('a'), Box('b'), Box('c'))
+        before = {key: root.child_by_key(key) for key in 'abc'}
+        render_objects = {key: element._render_object for key, element in before.items()}
+
+        self.assertIs(root.update(Box(children=[Box('c'), Box('a'), Box('b')])), root)
+
+        self.assertEqual([child.widget.key for child in root.children], ['c', 'a', 'b'])
+        self.assertEqual([child._slot for child in root.children], [0, 1, 2])
+        for key, element in before.items():
+            self.assertIs(root.child_by_key(key), element)
+            self.assertIs(element._render_object, render_objects[key])
+            self.assertEqual(element._render_object.updates, 1)
+        self.assertRenderChildren(root)
+
+    def test_unkeyed_children_match_by_type_in_order(self):
+        root = _mount(Box(), Other(), Box())
+        first_box, other, second_box = root.children
+
+        root.update_children([Other(), Box()])
+
+        self.assertEqual(root.children, [other, first_box])
+        self.assertEqual([child._slot for child in root.children], [0, 1])
+        self.assertDetached(second_box)
+        self.assertRenderChildren(root)
+
+    def test_changed_type_replaces_keyed_child(self):
+        root = _mount(Box('a'))
+        old = root.child_by_key('a')
+
+        root.update_children([Other('a')])
+
+        new = root.child_by_key('a')
+        self.assertIsNot(new, old)
+        self.assertIsInstance(new.widget, Other)
+        self.assertIs(new.parent, root)
+        self.assertDetached(old)
+        self.assertRenderChildren(root)
+
+    def test_removed_child_is_unmounted_with_its_subtree(self):
+        root = _mount(Box('a', children=[Box('x', children=[Box()])]), Box('b'))
+        removed = root.child_by_key('a')
+        inner = removed.child_by_key('x')
+        leaf = inner.children[0]
+        render_object = removed._render_object
+
+        root.update_children([Box('b')])
+
+        self.assertIsNone(root.child_by_key('a'))
+        for element in (removed, inner, leaf):
+            self.assertDetached(element)
+        self.assertIsNone(render_object.parent)
+        self.assertIsNone(render_object.element)
+        self.assertRenderChildren(root)
+
+    def test_new_children_are_nested_in_order(self):
+        root = _mount()
+
+        root.update_children([Box('a', children=[Box('x'), Box('y')])])
+
+        child = root.child_by_key('a')
+        self.assertIs(child.parent, root)
+        self.assertEqual([grandchild.widget.key for grandchild in child.children], ['x', 'y'])
+        self.assertIs(child.child_by_key('y')._render_object.parent, child._render_object)
+        self.assertEqual(child.child_by_key('y')._render_object.depth, 2)
+
+    def test_duplicate_keys_leave_children_untouched(self):
+        root = _mount(Box('a'), Box('b'))
+        children = list(root.children)
+        keyed = dict(root._keyed)
+
+        with self.assertRaises(ValueError):
+            root.update_children([Box('b'), Box('c'), Box('b')])
+
+        self.assertEqual(root.children, children)
+        self.assertEqual(root._keyed, keyed)
+        for child in children:
+            self.assertIs(child.parent, root)
+            self.assertIsNotNone(child._render_object)
+
+
+class MountTest(_ElementTest):
+    def test_unmount_removes_child_and_reslots_siblings(self):
+        root = _mount(Box('a'), Box('b'), Box('c'))
+        child = root.child_by_key('b')
+
+        child.unmount()
+
+        self.assertEqual([element.widget.key for element in root.children], ['a', 'c'])
+        self.assertEqual([element._slot for element in root.children], [0, 1])
+        self.assertIsNone(root.child_by_key('b'))
+        self.assertIsNone(child.parent)
+        self.assertRenderChildren(root)
+
+    def test_update_with_incompatible_widget_replaces_element_in_its_slot(self):
+        root = _mount(Box('a'), Box('b'), Box('c'))
+        old = root.child_by_key('b')
+
+        new = old.update(Other('b'))
+
+        self.assertIsNot(new, old)
+        self.assertIs(root.children[1], new)
+        self.assertEqual(new._slot, 1)
+        self.assertIs(root.child_by_key('b'), new)
+        self.assertIsNone(old.parent)
+        self.assertRenderChildren(root)
+
+
+if __name__ == '__main__':
+    unittest.main()
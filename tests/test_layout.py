@@ -0,0 +1,161 @@
+import unittest
+
+from framework.basic import RenderSizedBox, SizedBox
+from framework.core import PipelineOwner, SizeBox
+from framework.flex import Column, Flexible, Row
+
+
+class _Counting(RenderSizedBox):
+    def __init__(self, width, height):
+        super().__init__(width, height)
+        self.layouts = 0
+
+    def perform_layout(self, constraints):
+        self.layouts += 1
+        return super().perform_layout(constraints)
+
+
+class Box(SizedBox):
+    def create_render_object(self):
+        return _Counting(self.width, self.height)
+
+
+def _lay_out(widget, width, height):
+    element = widget.create_element()
+    element.mount(None)
+    owner = PipelineOwner()
+    owner.set_root(element._render_object)
+    owner.layout_root(SizeBox(width=width, height=height))
+    return element, owner
+
+
+def _render(element, *path):
+    for index in path:
+        element = element.children[index]
+    return element._render_object
+
+
+class FlexTest(unittest.TestCase):
+    def test_free_space_is_split_by_flex(self):
+        row, _ = _lay_out(
+            Row(
+                children=[
+                    SizedBox(width=4, height=1),
+                    Flexible(child=Box(width=0, height=1)),
+                    Flexible(flex=2, child=Box(width=0, height=1)),
+                ]
+            ),
+            10,
+            3,
+        )
+        children = row._render_object.children
+        self.assertEqual([child.size.width for child in children], [4, 2, 4])
+        self.assertEqual([child.position.x for child in children], [0, 4, 6])
+        self.assertEqual(row._render_object.size, SizeBox(width=10, height=3))
+
+    def test_rounding_leaves_no_gap(self):
+        row, _ = _lay_out(Row(children=[Flexible(child=Box(width=0, height=1)) for _ in range(3)]), 10, 1)
+        widths = [child.size.width for child in row._render_object.children]
+        self.assertEqual(sum(widths), 10)
+        self.assertLessEqual(max(widths) - min(widths), 1)
+
+    def test_column_stacks_fixed_children(self):
+        column, _ = _lay_out(Column(children=[SizedBox(width=5, height=2), SizedBox(width=7, height=3)]), 40, 10)
+        children = column._render_object.children
+        self.assertEqual([child.position.y for child in children], [0, 2])
+        self.assertEqual([child.size for child in children], [SizeBox(width=5, height=2), SizeBox(width=7, height=3)])
+
+    def test_fixed_children_are_clipped_to_the_space_left(self):
+        row, _ = _lay_out(Row(children=[SizedBox(width=6, height=1), SizedBox(width=6, height=1)]), 10, 1)
+        self.assertEqual([child.size.width for child in row._render_object.children], [6, 4])
+
+
+class RelayoutTest(unittest.TestCase):
+    def setUp(self):
+        self.tree = Column(
+            children=[
+                Box(width=5, height=2),
+                Flexible(
+                    child=Row(
+                        children=[
+                            Box(width=3, height=1),
+                            Flexible(child=Box(width=1, height=1, child=Box(width=1, height=1))),
+                        ]
+                    )
+                ),
+            ]
+        )
+        self.element, self.owner = _lay_out(self.tree, 40, 10)
+        self.fixed = _render(self.element, 0)
+        self.row_child = _render(self.element, 1, 0, 0)
+        self.sized = _render(self.element, 1, 0, 1, 0)
+        self.inner = _render(self.element, 1, 0, 1, 0, 0)
+        self.boxes = [self.fixed, self.row_child, self.sized, self.inner]
+        self.reset()
+
+    def reset(self):
+        for box in self.boxes:
+            box.layouts = 0
+
+    def test_same_constraints_skip_the_tree(self):
+        self.owner.layout_root(SizeBox(width=40, height=10))
+        self.assertEqual([box.layouts for box in self.boxes], [0, 0, 0, 0])
+
+    def test_new_constraints_relayout_once(self):
+        self.owner.layout_root(SizeBox(width=30, height=10))
+        self.assertEqual([box.layouts for box in self.boxes], [1, 1, 1, 1])
+        self.assertEqual(self.sized.size.width, 27)
+        self.owner.layout_root(SizeBox(width=30, height=10))
+        self.assertEqual([box.layouts for box in self.boxes], [1, 1, 1, 1])
+
+    def test_tightly_constrained_child_is_its_own_boundary(self):
+        self.assertIs(self.inner._relayout_boundary, self.inner)
+        self.inner.width = 2
+        self.inner.mark_needs_layout()
+        self.assertEqual(self.owner._needs_layout, [self.inner])
+        self.assertFalse(self.sized._needs_layout)
+
+        self.owner.flush_layout()
+
+        self.assertEqual([box.layouts for box in self.boxes], [0, 0, 0, 1])
+
+    def test_size_dependent_child_propagates_to_the_boundary(self):
+        root = self.element._render_object
+        self.assertIs(self.row_child._relayout_boundary, root)
+        self.row_child.width = 4
+        self.row_child.mark_needs_layout()
+        self.assertEqual(self.owner._needs_layout, [root])
+        self.assertTrue(_render(self.element, 1, 0)._needs_layout)
+
+        self.owner.flush_layout()
+
+        self.assertEqual(self.row_child.layouts, 1)
+        self.assertEqual(self.row_child.size.width, 4)
+        # The flexible sibling shrinks by the width the fixed child took.
+        self.assertEqual(self.sized.size.width, 36)
+        self.assertEqual(self.fixed.layouts, 0)
+
+    def test_widget_update_relayouts_changed_box(self):
+        self.element.update(
+            Column(
+                children=[
+                    Box(width=5, height=4),
+                    Flexible(
+                        child=Row(
+                            children=[
+                                Box(width=3, height=1),
+                                Flexible(child=Box(width=1, height=1, child=Box(width=1, height=1))),
+                            ]
+                        )
+                    ),
+                ]
+            )
+        )
+        self.owner.flush_layout()
+        self.assertEqual(self.fixed.size.height, 4)
+        self.assertEqual(_render(self.element, 1).position.y, 4)
+        self.assertEqual(self.inner.layouts, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
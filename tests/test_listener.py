@@ -0,0 +1,84 @@
+import asyncio
+import unittest
+
+from app.core.keys import KeyCode
+from app.core.listener import Listener
+from app.core.widgets.widget import Widget
+
+
+def _key(char: str) -> KeyCode:
+    return KeyCode.from_char(char)
+
+
+class ListenerSequenceTest(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+        self.listener = Listener()
+
+    def bind(self, keys, name):
+        self.listener.bind(keys, lambda widget, key: self.calls.append(name))
+
+    def type(self, text):
+        for char in text:
+            self.listener.dispatch(_key(char))
+
+    def test_longer_sequence_wins_over_single_key(self):
+        self.bind('g', 'g')
+        self.bind(['g', 'g'], 'gg')
+        self.type('gg')
+        self.assertEqual(self.calls, ['gg'])
+
+    def test_single_key_fires_when_sequence_does_not_continue(self):
+        self.bind('g', 'g')
+        self.bind(['g', 'g'], 'gg')
+        self.bind('x', 'x')
+        self.type('gx')
+        self.assertEqual(self.calls, ['g', 'x'])
+
+    def test_bound_prefix_fires_on_other_key(self):
+        self.bind(['d', 'd'], 'dd')
+        self.bind(['d', 'd', 'x'], 'ddx')
+        self.type('ddq')
+        self.assertEqual(self.calls, ['dd'])
+        self.assertIsNone(self.listener._prefix)
+        self.type('ddx')
+        self.assertEqual(self.calls, ['dd', 'ddx'])
+
+    def test_bound_prefix_fires_after_timeout(self):
+        self.listener.sequence_timeout = 0.05
+        self.bind(['d', 'd'], 'dd')
+        self.bind(['d', 'd', 'x'], 'ddx')
+
+        async def type_and_wait():
+            self.type('dd')
+            self.assertEqual(self.calls, [])
+            await asyncio.sleep(0.1)
+
+        asyncio.run(type_and_wait())
+        self.assertEqual(self.calls, ['dd'])
+        self.assertIsNone(self.listener._prefix)
+
+    def test_key_after_prefix_bubbles_to_parent(self):
+        self.bind('g', 'g')
+        self.bind(['g', 'g'], 'gg')
+        parent = Listener()
+        parent.bind('q', lambda widget, key: self.calls.append('q'))
+        outer, inner = _Node(parent), _Node(self.listener)
+        outer._adopt(inner)
+        self.listener.dispatch(_key('g'))
+        self.assertTrue(self.listener.dispatch(_key('q')))
+        self.assertEqual(self.calls, ['g', 'q'])
+
+
+class _Node(Widget):
+    def __init__(self, listener):
+        super().__init__()
+        self.listener = listener
+        listener.widget = self
+
+    def _render(self, width, height):
+        raise NotImplementedError
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+import asyncio
+import io
+import unittest
+
+from app.core.runner import AppRunner
+from app.core.widgets import DataBox, RootWidget
+from framework.core.graphics import Screen
+
+
+class _NoInput:
+    async def read_keys(self):
+        await asyncio.Event().wait()
+
+
+class _Keys:
+    def __init__(self, *batches):
+        self.batches = list(batches)
+
+    async def read_keys(self):
+        if not self.batches:
+            await asyncio.Event().wait()
+        await asyncio.sleep(0.05)
+        return self.batches.pop(0)
+
+
+class AppRunnerTest(unittest.IsolatedAsyncioTestCase):
+    async def test_first_frame_without_input(self):
+        root = RootWidget(child=DataBox(renderer=lambda box, width, height: ['hello']), size=(10, 2))
+        output = io.StringIO()
+        runner = AppRunner(root, _NoInput(), lambda keys: None, screen=Screen(output))
+        task = asyncio.create_task(runner.run())
+        await asyncio.sleep(0.1)
+        runner.stop()
+        await task
+        self.assertEqual(runner.stats.frames, 1)
+        self.assertIn('hello', output.getvalue())
+
+    async def test_keys_do_not_cause_an_extra_wake(self):
+        box = DataBox(renderer=lambda box, width, height: [str(box.variables['count'])], variables={'count': 0})
+        root = RootWidget(child=box, size=(10, 2))
+
+        def on_keys(keys):
+            box.variables['count'] += len(keys)
+
+        runner = AppRunner(root, _Keys(['a'], ['b', 'c']), on_keys, screen=Screen(io.StringIO()), fps=100)
+        task = asyncio.create_task(runner.run())
+        await asyncio.sleep(0.3)
+        runner.stop()
+        await task
+        self.assertEqual(runner.stats.keys, 3)
+        self.assertEqual(runner.stats.frames, 3)
+        self.assertEqual(runner.stats.skipped, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import asyncio
+import os
+import pty
+import unittest
+
+from app.core.keys import Key, KeyCode
+from app.core.tty_input import KeyDecoder, TerminalInputProcessor
+
+
+class KeyDecoderTest(unittest.TestCase):
+    def test_escape_sequences(self):
+        decoder = KeyDecoder()
+        keys = decoder.feed(b'\033[A\033[1;5C\033[3~\033[6~\033OP\033OB')
+        self.assertEqual(keys, [Key.up, Key.right, Key.delete, Key.page_down, Key.f1, Key.down])
+        self.assertFalse(decoder.pending)
+
+    def test_sequence_split_across_feeds(self):
+        decoder = KeyDecoder()
+        self.assertEqual(decoder.feed(b'\033['), [])
+        self.assertTrue(decoder.pending)
+        self.assertEqual(decoder.feed(b'15~'), [Key.f5])
+
+    def test_lone_escape_on_flush(self):
+        decoder = KeyDecoder()
+        self.assertEqual(decoder.feed(b'\033'), [])
+        self.assertEqual(decoder.flush(), [Key.esc])
+
+
+class TerminalInputProcessorTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.master, self.slave = pty.openpty()
+        self.processor = TerminalInputProcessor(self.slave, escape_timeout=0.05)
+        await self.processor.__aenter__()
+
+    async def asyncTearDown(self):
+        await self.processor.__aexit__(None, None, None)
+        os.close(self.master)
+        os.close(self.slave)
+
+    async def _read(self, *chunks: bytes, pause: float = 0.02) -> list:
+        for chunk in chunks:
+            os.write(self.master, chunk)
+            await asyncio.sleep(pause)
+        return await asyncio.wait_for(self.processor.read_keys(), 1)
+
+    async def test_arrows(self):
+        self.assertEqual(await self._read(b'\033[A\033[B\033[C\033[D'), [Key.up, Key.down, Key.right, Key.left])
+
+    async def test_csi_tilde_keys(self):
+        keys = await self._read(b'\033[2~\033[3~\033[5~\033[24~')
+        self.assertEqual(keys, [Key.insert, Key.delete, Key.page_up, Key.f12])
+
+    async def test_ss3_keys(self):
+        self.assertEqual(await self._read(b'\033OP\033OS\033OH'), [Key.f1, Key.f4, Key.home])
+
+    async def test_lone_escape_resolved_by_timeout(self):
+        os.write(self.master, b'\033')
+        await asyncio.sleep(0.01)
+        self.assertFalse(self.processor._buffer)
+        self.assertEqual(await asyncio.wait_for(self.processor.read_keys(), 1), [Key.esc])
+
+    async def test_utf8_key_split_across_reads(self):
+        encoded = 'ж'.encode()
+        self.assertEqual(await self._read(encoded[:1], encoded[1:]), [KeyCode.from_char('ж')])
+
+    async def test_characters(self):
+        self.assertEqual(await self._read(b'a\r\x7f'), [KeyCode.from_char('a'), Key.enter, Key.backspace])
+
+
+if __name__ == '__main__':
+    unittest.main()